@@ -0,0 +1,157 @@
+"""
+API测试脚本共用工具
+提供共享的HTTP会话、JSON解析/格式化、带缓存的健康检查和性能测试工具
+"""
+
+import atexit
+import functools
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 健康检查缓存有效期（秒）
+HEALTH_CACHE_SECONDS = 600
+
+# 复用同一个会话（连接池 + keep-alive），避免每个请求重新建立TCP连接
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0))
+SESSION.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+atexit.register(SESSION.close)
+
+
+def parse_json(response):
+    """解析响应JSON（优先使用orjson）"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def pretty_json(obj):
+    """格式化输出JSON，保留中文字符（优先使用orjson）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def encode_json(obj):
+    """把请求体预先序列化为JSON字节串，便于在循环中重复发送"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_health(base_url, bucket):
+    """请求 /health 并缓存结果，bucket 变化时缓存失效"""
+    response = SESSION.get(f"{base_url}/health", timeout=5)
+    return response.status_code, parse_json(response)
+
+
+def get_health(base_url):
+    """
+    获取健康检查结果（同一进程内10分钟内只请求一次）
+
+    Returns:
+        tuple: (状态码, 响应JSON)
+    """
+    return _cached_health(base_url, int(time.time() // HEALTH_CACHE_SECONDS))
+
+
+def timed_post(url, body):
+    """发送一次POST请求（body为预先序列化的JSON字节串），返回 (耗时毫秒, 是否成功)"""
+    start = time.perf_counter_ns()
+    # 只检查状态码，不解析响应体；with 块结束即释放响应缓冲区
+    with SESSION.post(url, data=body, timeout=10) as response:
+        ok = response.status_code == 200
+    elapsed = (time.perf_counter_ns() - start) / 1e6  # 转换为毫秒
+    return elapsed, ok
+
+
+def run_requests(url, body, n_requests, concurrent=True):
+    """
+    发送n_requests个相同的POST请求（concurrent为True时用线程池并发发送，否则串行）
+
+    Returns:
+        tuple: (结果列表, 总耗时毫秒)；每个结果为 (耗时毫秒, 是否成功)，请求失败时为抛出的异常
+    """
+    outcomes = []
+    wall_start = time.perf_counter_ns()
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=n_requests) as pool:
+            futures = [pool.submit(timed_post, url, body) for _ in range(n_requests)]
+        for future in futures:
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                outcomes.append(e)
+    else:
+        for _ in range(n_requests):
+            try:
+                outcomes.append(timed_post(url, body))
+            except Exception as e:
+                outcomes.append(e)
+    wall_time = (time.perf_counter_ns() - wall_start) / 1e6
+    return outcomes, wall_time
+
+
+def latency_stats(samples):
+    """计算延迟统计：中位数及P95/P99（样本不足2个时退化为中位数）"""
+    median = statistics.median(samples)
+    if len(samples) >= 2:
+        percentiles = statistics.quantiles(samples, n=100, method="inclusive")
+        p95, p99 = percentiles[94], percentiles[98]
+    else:
+        p95 = p99 = median
+    return median, p95, p99
+
+
+def batched_performance(base_url, n_requests=10):
+    """
+    测试批量接口性能（n个样本合并为一次请求），并以单样本请求作对照
+
+    Returns:
+        bool: 批量请求是否成功
+    """
+    features = {
+        "存活数": 1000,
+        "感染率": 0.5,
+        "治疗覆盖率": 85.0
+    }
+    
+    print(f"发送 1 个批量请求（{n_requests} 个样本）...")
+    try:
+        start = time.perf_counter_ns()
+        response = SESSION.post(
+            f"{base_url}/v1/predict/batch",
+            json={"samples": [features] * n_requests},
+            timeout=30
+        )
+        batch_ms = (time.perf_counter_ns() - start) / 1e6
+        if response.status_code != 200:
+            print(f"✗ 批量请求失败: 状态码 {response.status_code}")
+            return False
+        
+        # 对照：单样本请求耗时
+        single_ms, single_ok = timed_post(f"{base_url}/v1/predict", encode_json({"features": features}))
+    except Exception as e:
+        print(f"✗ 请求失败: {e}")
+        return False
+    
+    per_sample_ms = batch_ms / n_requests
+    print(f"\n批量性能统计:")
+    print(f"  批量请求总耗时: {batch_ms:.2f}ms")
+    print(f"  单样本平均耗时: {per_sample_ms:.2f}ms")
+    if single_ok:
+        print(f"  单次请求耗时(对照): {single_ms:.2f}ms")
+        print(f"  批量加速比: {single_ms / per_sample_ms:.1f}x")
+    print("✓ 批量性能测试完成")
+    return True
@@ -0,0 +1,149 @@
+"""
+Shared pytest configuration for the reorganization tool tests.
+
+Every test works in its own copy of a sample project, and shared templates
+are built through tmp_path_factory (one per xdist worker), so the tests are
+safe to run in parallel with pytest-xdist (``pytest -n auto``). Temporary
+directories are staged in /dev/shm (tmpfs) when it is available.
+"""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from reorg_tool.config_loader import ConfigLoader
+
+
+SHM_DIR = "/dev/shm"
+
+# Set to keep the per-run /dev/shm basetemp for debugging (otherwise it is removed)
+KEEP_TMP_ENV = "REORG_KEEP_TMP"
+
+
+# Per-run basetemp created in /dev/shm by pytest_configure (unset when not used)
+_SHM_BASETEMP = pytest.StashKey[str]()
+
+
+def pytest_configure(config):
+    """Stage tmp_path directories in RAM when /dev/shm is available."""
+    if not (os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK)):
+        return
+    if config.option.basetemp is not None or hasattr(config, "workerinput"):
+        return  # Explicit --basetemp wins; xdist workers inherit the controller's
+    # A fresh directory per run: pytest empties an explicit basetemp at startup,
+    # so a fixed name would let concurrent runs delete each other's files
+    basetemp = tempfile.mkdtemp(prefix=f"pytest-{os.getuid()}-", dir=SHM_DIR)
+    config.option.basetemp = basetemp
+    config.stash[_SHM_BASETEMP] = basetemp
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session, exitstatus):
+    """Free the per-run /dev/shm basetemp (RAM) unless REORG_KEEP_TMP is set."""
+    basetemp = session.config.stash.get(_SHM_BASETEMP, None)
+    if basetemp is not None and not os.environ.get(KEEP_TMP_ENV):
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Tell the user where a kept /dev/shm basetemp is, so it can be inspected and removed."""
+    basetemp = config.stash.get(_SHM_BASETEMP, None)
+    if basetemp is not None and os.environ.get(KEEP_TMP_ENV):
+        terminalreporter.write_line(f"{KEEP_TMP_ENV} set: tmp_path directories kept in {basetemp}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _mkdtemp_in_basetemp(tmp_path_factory):
+    """Create tempfile.mkdtemp() directories under this run's basetemp (unless TMPDIR is set)."""
+    if "TMPDIR" in os.environ:
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tempfile, "tempdir", str(tmp_path_factory.mktemp("mkdtemp")))
+        yield
+
+
+def _link_or_copy(src, dst):
+    """Hardlink a file from the template, falling back to a real copy."""
+    try:
+        os.link(src, dst)
+    except OSError:  # cross-device, or no hardlink support (e.g. some Windows setups)
+        shutil.copy2(src, dst)
+    return dst
+
+
+@pytest.fixture(scope="session")
+def build_template(tmp_path_factory):
+    """
+    Build a read-only sample project tree; returns build(name, content_files, touch_files).
+    
+    content_files are (relpath, bytes) pairs, touch_files are relpaths created
+    empty. The tree is created at <mktemp(name)>/test_project.
+    """
+    def build(name, content_files, touch_files=()):
+        project_root = tmp_path_factory.mktemp(name) / "test_project"
+        
+        # Create each directory once, then write the files
+        paths = [rel for rel, _ in content_files] + list(touch_files)
+        for parent in {os.path.dirname(rel) for rel in paths}:
+            os.makedirs(project_root / parent, exist_ok=True)
+        for rel, data in content_files:
+            (project_root / rel).write_bytes(data)
+        for rel in touch_files:
+            (project_root / rel).touch()
+        
+        return project_root
+    
+    return build
+
+
+@pytest.fixture(scope="session")
+def link_tree():
+    """
+    Copy a template tree by hardlinking its files; returns copy(template, dest) -> dest.
+    
+    Tests may unlink or replace the copied files but must not write into
+    them in place, or the template changes too.
+    """
+    def copy(template, dest):
+        shutil.copytree(template, dest, copy_function=_link_or_copy)
+        return dest
+    
+    return copy
+
+
+@pytest.fixture(scope="session")
+def shared_empty_dir(tmp_path_factory):
+    """An empty directory shared by tests that only read it; do not write into it."""
+    return tmp_path_factory.mktemp("reorg_shared")
+
+
+@pytest.fixture
+def yes_input(monkeypatch):
+    """Answer "yes" to every input() prompt; returns the list of prompts asked."""
+    prompts = []
+    
+    def _input(prompt=""):
+        prompts.append(prompt)
+        return "yes"
+    
+    monkeypatch.setattr("builtins.input", _input)
+    return prompts
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache():
+    """Isolate tests from config files parsed and project roots validated by earlier tests."""
+    ConfigLoader.clear_cache()
+    yield
+    ConfigLoader.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def _no_cwd_leak():
+    """Fail tests that change directory without monkeypatch.chdir (unsafe under xdist)."""
+    cwd = os.getcwd()
+    yield
+    assert os.getcwd() == cwd, "test changed the working directory; use monkeypatch.chdir"
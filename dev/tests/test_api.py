@@ -3,30 +3,32 @@ API测试脚本
 用于验证API服务是否正常工作
 """
 
-import requests
-import json
+import argparse
 import time
 
+from _testutil import (SESSION, batched_performance, encode_json, get_health, latency_stats,
+                       parse_json, pretty_json, run_requests)
+
 # API基础URL
 BASE_URL = "http://localhost:5000"
 
+# 分隔线
+_BAR = "=" * 60
+
 def print_section(title):
     """打印分隔线"""
-    print("\n" + "="*60)
-    print(f"  {title}")
-    print("="*60)
+    print(f"\n{_BAR}\n  {title}\n{_BAR}")
 
 def test_health():
     """测试健康检查"""
     print_section("测试1: 健康检查")
     
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
-        print(f"状态码: {response.status_code}")
-        print(f"响应: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+        status_code, data = get_health(BASE_URL)
+        print(f"状态码: {status_code}")
+        print(f"响应: {pretty_json(data)}")
         
-        if response.status_code == 200:
-            data = response.json()
+        if status_code == 200:
             if data.get('status') == 'healthy' and data.get('model_loaded'):
                 print("✓ 健康检查通过")
                 return True
@@ -43,15 +45,15 @@ def test_model_info():
     print_section("测试2: 获取模型信息")
     
     try:
-        response = requests.get(f"{BASE_URL}/v1/model/info", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/v1/model/info", timeout=5)
         print(f"状态码: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print(f"模型名称: {data.get('model_name')}")
             print(f"模型版本: {data.get('model_version')}")
             print(f"特征数量: {data.get('feature_count')}")
-            print(f"风险等级: {json.dumps(data.get('risk_levels'), indent=2, ensure_ascii=False)}")
+            print(f"风险等级: {pretty_json(data.get('risk_levels'))}")
             print("✓ 模型信息获取成功")
             return True
         
@@ -79,18 +81,17 @@ def test_predict_single():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/v1/predict",
-            headers={"Content-Type": "application/json"},
             json={"features": features},
             timeout=10
         )
         
+        data = parse_json(response)
         print(f"状态码: {response.status_code}")
-        print(f"响应: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+        print(f"响应: {pretty_json(data)}")
         
         if response.status_code == 200:
-            data = response.json()
             if data.get('success'):
                 pred = data.get('prediction', {})
                 print(f"\n预测结果:")
@@ -131,9 +132,8 @@ def test_predict_batch():
     ]
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/v1/predict/batch",
-            headers={"Content-Type": "application/json"},
             json={"samples": samples},
             timeout=10
         )
@@ -141,7 +141,7 @@ def test_predict_batch():
         print(f"状态码: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             if data.get('success'):
                 print(f"总样本数: {data.get('total')}")
                 print(f"\n预测结果:")
@@ -161,8 +161,12 @@ def test_predict_batch():
         print(f"✗ 请求失败: {e}")
         return False
 
-def test_performance():
-    """测试性能"""
+def test_performance(concurrent=True):
+    """测试性能
+
+    Args:
+        concurrent: True时并发发送请求（线程池），False时串行发送
+    """
     print_section("测试5: 性能测试")
     
     features = {
@@ -173,71 +177,88 @@ def test_performance():
     
     n_requests = 10
     times = []
+    url = f"{BASE_URL}/v1/predict"
+    body = encode_json({"features": features})  # 只序列化一次
     
-    print(f"发送 {n_requests} 个请求...")
+    # 预热：先建立连接，避免首次握手计入统计
+    try:
+        SESSION.post(url, data=body, timeout=10)
+    except Exception:
+        pass
+
+    mode = "并发" if concurrent else "串行"
+    print(f"{mode}发送 {n_requests} 个请求...")
+
+    outcomes, wall_time = run_requests(url, body, n_requests, concurrent)
     
-    for i in range(n_requests):
-        try:
-            start = time.time()
-            response = requests.post(
-                f"{BASE_URL}/v1/predict",
-                headers={"Content-Type": "application/json"},
-                json={"features": features},
-                timeout=10
-            )
-            elapsed = (time.time() - start) * 1000  # 转换为毫秒
-            
-            if response.status_code == 200:
-                times.append(elapsed)
-                print(f"  请求 {i+1}: {elapsed:.2f}ms")
-        except Exception as e:
-            print(f"  请求 {i+1}: 失败 - {e}")
+    for i, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            print(f"  请求 {i+1}: 失败 - {outcome}")
+            continue
+        elapsed, ok = outcome
+        if ok:
+            times.append(elapsed)
+            print(f"  请求 {i+1}: {elapsed:.2f}ms")
     
     if times:
-        avg_time = sum(times) / len(times)
+        median_time, p95_time, p99_time = latency_stats(times)
         min_time = min(times)
         max_time = max(times)
         
         print(f"\n性能统计:")
-        print(f"  平均响应时间: {avg_time:.2f}ms")
+        print(f"  响应时间中位数(P50): {median_time:.2f}ms")
+        print(f"  P95响应时间: {p95_time:.2f}ms")
+        print(f"  P99响应时间: {p99_time:.2f}ms")
         print(f"  最快响应时间: {min_time:.2f}ms")
         print(f"  最慢响应时间: {max_time:.2f}ms")
+        print(f"  总耗时: {wall_time:.2f}ms ({len(times)/wall_time*1000:.1f} 请求/秒)")
         print(f"  成功率: {len(times)}/{n_requests} ({len(times)/n_requests*100:.1f}%)")
         
-        if avg_time < 100:
-            print("✓ 性能测试通过 (平均响应时间 < 100ms)")
+        if median_time < 100:
+            print("✓ 性能测试通过 (响应时间中位数 < 100ms)")
             return True
         else:
-            print("⚠ 性能测试警告 (平均响应时间 > 100ms)")
+            print("⚠ 性能测试警告 (响应时间中位数 > 100ms)")
             return True
     
     print("✗ 性能测试失败")
     return False
 
+def test_performance_batched():
+    """测试批量接口性能（n个样本合并为一次请求）"""
+    print_section("测试6: 批量性能测试")
+    return batched_performance(BASE_URL)
+
 def main():
     """运行所有测试"""
-    print("\n" + "="*60)
+    parser = argparse.ArgumentParser(description="HIV风险评估API自动化测试")
+    parser.add_argument("--sync", action="store_true",
+                        help="性能测试改为串行发送请求（对照模式）")
+    parser.add_argument("--pace", type=float, default=0,
+                        help="各测试之间的间隔秒数（默认0，用于限流测试）")
+    args = parser.parse_args()
+    
+    print(f"\n{_BAR}")
     print("  HIV风险评估API - 自动化测试")
-    print("="*60)
+    print(_BAR)
     print(f"  目标地址: {BASE_URL}")
-    print("="*60)
+    print(_BAR)
     
-    results = []
+    tests = [
+        ("健康检查", test_health),
+        ("模型信息", test_model_info),
+        ("单样本预测", test_predict_single),
+        ("批量预测", test_predict_batch),
+        ("性能测试", lambda: test_performance(concurrent=not args.sync)),
+        ("批量性能测试", test_performance_batched),
+    ]
     
     # 运行测试
-    results.append(("健康检查", test_health()))
-    time.sleep(1)
-    
-    results.append(("模型信息", test_model_info()))
-    time.sleep(1)
-    
-    results.append(("单样本预测", test_predict_single()))
-    time.sleep(1)
-    
-    results.append(("批量预测", test_predict_batch()))
-    time.sleep(1)
-    
-    results.append(("性能测试", test_performance()))
+    results = []
+    for i, (name, test) in enumerate(tests):
+        if i and args.pace:
+            time.sleep(args.pace)
+        results.append((name, test()))
     
     # 汇总结果
     print_section("测试结果汇总")
@@ -3,27 +3,31 @@
 测试特征贡献度和特征重要性功能
 """
 
-import requests
-import json
+import argparse
+import statistics
 import time
 
+from _testutil import (SESSION, batched_performance, encode_json, get_health, latency_stats,
+                       parse_json, pretty_json, run_requests)
+
 BASE_URL = "http://localhost:5000"
 
+# 分隔线
+_BAR = "=" * 80
+
 def print_section(title):
     """打印分隔线"""
-    print("\n" + "="*80)
-    print(f"  {title}")
-    print("="*80)
+    print(f"\n{_BAR}\n  {title}\n{_BAR}")
 
 def test_health():
     """测试健康检查"""
     print_section("测试1: 健康检查")
     
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
-        print(f"状态码: {response.status_code}")
-        print(f"响应: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
-        return response.status_code == 200
+        status_code, data = get_health(BASE_URL)
+        print(f"状态码: {status_code}")
+        print(f"响应: {pretty_json(data)}")
+        return status_code == 200
     except Exception as e:
         print(f"✗ 请求失败: {e}")
         return False
@@ -33,11 +37,11 @@ def test_model_info():
     print_section("测试2: 模型信息")
     
     try:
-        response = requests.get(f"{BASE_URL}/v1/model/info", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/v1/model/info", timeout=5)
         print(f"状态码: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print(f"模型名称: {data.get('model_name')}")
             print(f"模型版本: {data.get('model_version')}")
             print(f"特征数量: {data.get('feature_count')}")
@@ -62,9 +66,8 @@ def test_predict_basic():
     
     try:
         start_time = time.time()
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/v1/predict",
-            headers={"Content-Type": "application/json"},
             json={"features": features},
             timeout=10
         )
@@ -74,8 +77,8 @@ def test_predict_basic():
         print(f"响应时间: {elapsed_ms:.2f} ms")
         
         if response.status_code == 200:
-            data = response.json()
-            print(f"\n响应: {json.dumps(data, indent=2, ensure_ascii=False)}")
+            data = parse_json(response)
+            print(f"\n响应: {pretty_json(data)}")
             
             pred = data.get('prediction', {})
             print(f"\n预测结果:")
@@ -106,9 +109,8 @@ def test_predict_with_contributions():
     
     try:
         start_time = time.time()
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/v1/predict",
-            headers={"Content-Type": "application/json"},
             json={
                 "features": features,
                 "include_contributions": True  # 启用特征贡献度
@@ -121,7 +123,7 @@ def test_predict_with_contributions():
         print(f"响应时间: {elapsed_ms:.2f} ms")
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             
             pred = data.get('prediction', {})
             print(f"\n预测结果:")
@@ -158,7 +160,7 @@ def test_feature_importance():
     
     try:
         # 测试Top 10
-        response = requests.get(
+        response = SESSION.get(
             f"{BASE_URL}/v1/model/feature_importance?top_k=10",
             timeout=5
         )
@@ -166,7 +168,7 @@ def test_feature_importance():
         print(f"状态码: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             print(f"Top K: {data.get('top_k')}")
             print(f"总特征数: {data.get('total_features')}")
             
@@ -180,8 +182,24 @@ def test_feature_importance():
         print(f"✗ 请求失败: {e}")
         return False
 
-def test_performance():
-    """测试性能对比"""
+def _successful_times(outcomes):
+    """打印失败的请求，返回成功请求的耗时列表"""
+    times = []
+    for i, outcome in enumerate(outcomes):
+        if isinstance(outcome, Exception):
+            print(f"  请求 {i+1}: 失败 - {outcome}")
+            continue
+        elapsed, ok = outcome
+        if ok:
+            times.append(elapsed)
+    return times
+
+def test_performance(concurrent=True):
+    """测试性能对比
+
+    Args:
+        concurrent: True时并发发送请求（线程池），False时串行发送
+    """
     print_section("测试6: 性能对比")
     
     features = {
@@ -191,55 +209,47 @@ def test_performance():
     }
     
     n_requests = 10
-    
+    url = f"{BASE_URL}/v1/predict"
+    mode = "并发" if concurrent else "串行"
+
+    # 请求体只序列化一次
+    basic_body = encode_json({"features": features})
+    enhanced_body = encode_json({"features": features, "include_contributions": True})
+
+    # 预热：先建立连接，避免首次握手计入统计
+    try:
+        SESSION.post(url, data=basic_body, timeout=10)
+    except Exception:
+        pass
+
     # 测试基础预测
-    print(f"\n基础预测（不含特征贡献度）- {n_requests}次请求:")
-    times_basic = []
-    for i in range(n_requests):
-        try:
-            start = time.time()
-            response = requests.post(
-                f"{BASE_URL}/v1/predict",
-                headers={"Content-Type": "application/json"},
-                json={"features": features},
-                timeout=10
-            )
-            elapsed = (time.time() - start) * 1000
-            if response.status_code == 200:
-                times_basic.append(elapsed)
-        except:
-            pass
+    print(f"\n基础预测（不含特征贡献度）- {n_requests}次{mode}请求:")
+    outcomes, wall_basic = run_requests(url, basic_body, n_requests, concurrent)
+    times_basic = _successful_times(outcomes)
     
     if times_basic:
-        print(f"  平均响应时间: {sum(times_basic)/len(times_basic):.2f} ms")
+        median_time, p95_time, p99_time = latency_stats(times_basic)
+        print(f"  响应时间中位数(P50): {median_time:.2f} ms")
+        print(f"  P95: {p95_time:.2f} ms  P99: {p99_time:.2f} ms")
         print(f"  最快: {min(times_basic):.2f} ms")
         print(f"  最慢: {max(times_basic):.2f} ms")
+        print(f"  总耗时: {wall_basic:.2f} ms")
     
     # 测试增强预测
-    print(f"\n增强预测（含特征贡献度）- {n_requests}次请求:")
-    times_enhanced = []
-    for i in range(n_requests):
-        try:
-            start = time.time()
-            response = requests.post(
-                f"{BASE_URL}/v1/predict",
-                headers={"Content-Type": "application/json"},
-                json={"features": features, "include_contributions": True},
-                timeout=10
-            )
-            elapsed = (time.time() - start) * 1000
-            if response.status_code == 200:
-                times_enhanced.append(elapsed)
-        except:
-            pass
+    print(f"\n增强预测（含特征贡献度）- {n_requests}次{mode}请求:")
+    outcomes, wall_enhanced = run_requests(url, enhanced_body, n_requests, concurrent)
+    times_enhanced = _successful_times(outcomes)
     
     if times_enhanced:
-        print(f"  平均响应时间: {sum(times_enhanced)/len(times_enhanced):.2f} ms")
+        median_time, p95_time, p99_time = latency_stats(times_enhanced)
+        print(f"  响应时间中位数(P50): {median_time:.2f} ms")
+        print(f"  P95: {p95_time:.2f} ms  P99: {p99_time:.2f} ms")
         print(f"  最快: {min(times_enhanced):.2f} ms")
         print(f"  最慢: {max(times_enhanced):.2f} ms")
+        print(f"  总耗时: {wall_enhanced:.2f} ms")
     
     if times_basic and times_enhanced:
-        overhead = sum(times_enhanced)/len(times_enhanced) - sum(times_basic)/len(times_basic)
+        overhead = statistics.median(times_enhanced) - statistics.median(times_basic)
         print(f"\n特征贡献度开销: +{overhead:.2f} ms")
         
         if overhead < 50:
@@ -251,33 +261,42 @@ def test_performance():
     
     return False
 
+def test_performance_batched():
+    """测试批量接口性能（n个样本合并为一次请求）"""
+    print_section("测试7: 批量性能测试")
+    return batched_performance(BASE_URL)
+
 def main():
     """运行所有测试"""
-    print("\n" + "="*80)
+    parser = argparse.ArgumentParser(description="HIV风险评估API增强功能测试")
+    parser.add_argument("--sync", action="store_true",
+                        help="性能测试改为串行发送请求（对照模式）")
+    parser.add_argument("--pace", type=float, default=0,
+                        help="各测试之间的间隔秒数（默认0，用于限流测试）")
+    args = parser.parse_args()
+    
+    print(f"\n{_BAR}")
     print("  HIV风险评估API - 增强功能测试")
-    print("="*80)
+    print(_BAR)
     print(f"  目标地址: {BASE_URL}")
-    print("="*80)
+    print(_BAR)
     
-    results = []
+    tests = [
+        ("健康检查", test_health),
+        ("模型信息", test_model_info),
+        ("基础预测", test_predict_basic),
+        ("增强预测", test_predict_with_contributions),
+        ("特征重要性", test_feature_importance),
+        ("性能对比", lambda: test_performance(concurrent=not args.sync)),
+        ("批量性能", test_performance_batched),
+    ]
     
     # 运行测试
-    results.append(("健康检查", test_health()))
-    time.sleep(0.5)
-    
-    results.append(("模型信息", test_model_info()))
-    time.sleep(0.5)
-    
-    results.append(("基础预测", test_predict_basic()))
-    time.sleep(0.5)
-    
-    results.append(("增强预测", test_predict_with_contributions()))
-    time.sleep(0.5)
-    
-    results.append(("特征重要性", test_feature_importance()))
-    time.sleep(0.5)
-    
-    results.append(("性能对比", test_performance()))
+    results = []
+    for i, (name, test) in enumerate(tests):
+        if i and args.pace:
+            time.sleep(args.pace)
+        results.append((name, test()))
     
     # 汇总结果
     print_section("测试结果汇总")
@@ -3,88 +3,106 @@
 测试API修复
 """
 
-import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
+
+from _testutil import SESSION, get_health, parse_json, pretty_json
 
 API_URL = "http://localhost:5000"
 
-def test_basic_predict():
-    """测试基础预测"""
-    print("\n" + "="*60)
+# 分隔线
+_BAR = "=" * 60
+
+# 三个测试的请求体
+BASIC_PAYLOAD = {
+    "features": {
+        "存活数": 1000,
+        "感染率": 0.5,
+        "治疗覆盖率": 85.0,
+        "新报告": 50,
+        "人口数": 500000
+    }
+}
+
+CONTRIBUTIONS_PAYLOAD = {
+    "features": {
+        "存活数": 1200,
+        "感染率": 0.12,
+        "治疗覆盖率": 92.0,
+        "新报告": 80,
+        "人口数": 600000
+    },
+    "include_contributions": True
+}
+
+ATTENTION_PAYLOAD = {
+    "features": {
+        "存活数": 1500,
+        "感染率": 0.25,
+        "治疗覆盖率": 78.0,
+        "新报告": 120,
+        "人口数": 800000
+    },
+    "include_contributions": True,
+    "include_attention": True,
+    "use_enhanced": True
+}
+
+def _post_predict(payload):
+    """发送单样本预测请求"""
+    return SESSION.post(f"{API_URL}/v1/predict", json=payload)
+
+def test_basic_predict(response=None):
+    """测试基础预测（可传入已完成的响应）"""
+    print(f"\n{_BAR}")
     print("测试1: 基础预测（不含特征贡献度）")
-    print("="*60)
+    print(_BAR)
     
-    response = requests.post(f"{API_URL}/v1/predict", json={
-        "features": {
-            "存活数": 1000,
-            "感染率": 0.5,
-            "治疗覆盖率": 85.0,
-            "新报告": 50,
-            "人口数": 500000
-        }
-    })
+    if response is None:
+        response = _post_predict(BASIC_PAYLOAD)
     
     print(f"状态码: {response.status_code}")
-    print(f"响应: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+    print(f"响应: {pretty_json(parse_json(response))}")
     
     return response.status_code == 200
 
-def test_predict_with_contributions():
-    """测试含特征贡献度的预测"""
-    print("\n" + "="*60)
+def test_predict_with_contributions(response=None):
+    """测试含特征贡献度的预测（可传入已完成的响应）"""
+    print(f"\n{_BAR}")
     print("测试2: 增强预测（含特征贡献度）")
-    print("="*60)
+    print(_BAR)
     
-    response = requests.post(f"{API_URL}/v1/predict", json={
-        "features": {
-            "存活数": 1200,
-            "感染率": 0.12,
-            "治疗覆盖率": 92.0,
-            "新报告": 80,
-            "人口数": 600000
-        },
-        "include_contributions": True
-    })
+    if response is None:
+        response = _post_predict(CONTRIBUTIONS_PAYLOAD)
     
     print(f"状态码: {response.status_code}")
-    print(f"响应: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+    print(f"响应: {pretty_json(parse_json(response))}")
     
     return response.status_code == 200
 
-def test_predict_with_attention():
-    """测试含注意力权重的预测"""
-    print("\n" + "="*60)
+def test_predict_with_attention(response=None):
+    """测试含注意力权重的预测（可传入已完成的响应）"""
+    print(f"\n{_BAR}")
     print("测试3: 完整增强预测（含注意力权重）")
-    print("="*60)
+    print(_BAR)
     
-    response = requests.post(f"{API_URL}/v1/predict", json={
-        "features": {
-            "存活数": 1500,
-            "感染率": 0.25,
-            "治疗覆盖率": 78.0,
-            "新报告": 120,
-            "人口数": 800000
-        },
-        "include_contributions": True,
-        "include_attention": True,
-        "use_enhanced": True
-    })
+    if response is None:
+        response = _post_predict(ATTENTION_PAYLOAD)
     
     print(f"状态码: {response.status_code}")
-    print(f"响应: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+    print(f"响应: {pretty_json(parse_json(response))}")
     
     return response.status_code == 200
 
 def main():
     """运行所有测试"""
-    print("\n" + "="*60)
+    print(f"\n{_BAR}")
     print("API修复测试")
-    print("="*60)
+    print(_BAR)
     
     # 检查API是否运行
     try:
-        response = requests.get(f"{API_URL}/health")
-        if response.status_code != 200:
+        status_code, _ = get_health(API_URL)
+        if status_code != 200:
             print("❌ API未运行，请先启动API服务")
             print("   运行: python3 api/app.py")
             return
@@ -95,27 +113,33 @@ def main():
     
     print("✓ API正在运行")
     
+    # 三个预测请求相互独立，并发发送
+    # （/v1/predict/batch 不支持逐样本指定 include_contributions/include_attention）
+    payloads = [BASIC_PAYLOAD, CONTRIBUTIONS_PAYLOAD, ATTENTION_PAYLOAD]
+    with ThreadPoolExecutor(max_workers=len(payloads)) as pool:
+        basic_resp, contrib_resp, attention_resp = pool.map(_post_predict, payloads)
+    
     # 运行测试
     results = []
-    results.append(("基础预测", test_basic_predict()))
-    results.append(("含特征贡献度", test_predict_with_contributions()))
-    results.append(("含注意力权重", test_predict_with_attention()))
+    results.append(("基础预测", test_basic_predict(basic_resp)))
+    results.append(("含特征贡献度", test_predict_with_contributions(contrib_resp)))
+    results.append(("含注意力权重", test_predict_with_attention(attention_resp)))
     
     # 总结
-    print("\n" + "="*60)
+    print(f"\n{_BAR}")
     print("测试总结")
-    print("="*60)
+    print(_BAR)
     for name, passed in results:
         status = "✓ 通过" if passed else "❌ 失败"
         print(f"{name:20s}: {status}")
     
     all_passed = all(r[1] for r in results)
-    print("\n" + "="*60)
+    print(f"\n{_BAR}")
     if all_passed:
         print("✓ 所有测试通过！")
     else:
         print("❌ 部分测试失败")
-    print("="*60)
+    print(_BAR)
 
 if __name__ == '__main__':
     main()
@@ -3,6 +3,7 @@
 测试注意力权重功能
 """
 
+import functools
 import sys
 import os
 
@@ -12,12 +13,27 @@ sys.path.insert(0, project_root)
 
 from models.enhanced_predictor import EnhancedPredictor
 
+
+@functools.lru_cache(maxsize=None)
+def get_predictor(model_path='saved_models/final_model_3to5.pkl'):
+    """同一模型路径只加载一次预测器"""
+    return EnhancedPredictor(model_path)
+
+
+@functools.lru_cache(maxsize=4)
+def predict_full(features_key):
+    """同一组特征只做一次完整预测（含注意力权重和特征贡献度）"""
+    return get_predictor().predict_single(
+        dict(features_key), return_attention=True, include_contributions=True
+    )
+
+
 # 初始化增强预测器
 print("="*60)
 print("测试增强预测器的注意力权重功能")
 print("="*60)
 
-predictor = EnhancedPredictor('saved_models/final_model_3to5.pkl')
+predictor = get_predictor()
 
 # 测试数据
 features = {
@@ -28,16 +44,21 @@ features = {
     '人口数': 800000
 }
 
+# 只做一次前向计算（同时请求注意力权重和特征贡献度），各测试取所需子集
+features_key = tuple(sorted(features.items()))
+result = predict_full(features_key)
+result1 = {k: v for k, v in result.items() if k not in ('attention_weights', 'feature_contributions')}
+result2 = {k: v for k, v in result.items() if k != 'feature_contributions'}
+result3 = result
+
 print("\n测试1: 基础预测（不含注意力权重）")
 print("-"*60)
-result1 = predictor.predict_single(features, return_attention=False)
 print(f"风险等级: {result1['risk_level_5']} - {result1['risk_description']}")
 print(f"风险分数: {result1['risk_score']:.2f}")
 print(f"注意力权重: {result1.get('attention_weights', '未请求')}")
 
 print("\n测试2: 增强预测（含注意力权重）")
 print("-"*60)
-result2 = predictor.predict_single(features, return_attention=True)
 print(f"风险等级: {result2['risk_level_5']} - {result2['risk_description']}")
 print(f"风险分数: {result2['risk_score']:.2f}")
 
@@ -55,7 +76,6 @@ else:
 
 print("\n测试3: 完整增强预测（含注意力权重和特征贡献度）")
 print("-"*60)
-result3 = predictor.predict_single(features, return_attention=True, include_contributions=True)
 print(f"风险等级: {result3['risk_level_5']} - {result3['risk_description']}")
 print(f"风险分数: {result3['risk_score']:.2f}")
 
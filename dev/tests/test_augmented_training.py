@@ -3,70 +3,114 @@
 策略: 190真实数据 + N条合成数据
 """
 
+import os
+
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import GradientBoostingClassifier
+from joblib import Parallel, delayed
+from sklearn.ensemble import HistGradientBoostingClassifier
 from sklearn.model_selection import cross_val_score, StratifiedKFold
+from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import StandardScaler
 from sdv.single_table import CTGANSynthesizer
 from sdv.metadata import SingleTableMetadata
 import warnings
 warnings.filterwarnings('ignore')
 
+# 可选：安装了 cuML 时在GPU上训练评估模型
+try:
+    from cuml.ensemble import RandomForestClassifier as GPURandomForestClassifier
+except ImportError:
+    GPURandomForestClassifier = None
 
-def generate_more_synthetic_data(real_df, n_synthetic, model_path=None):
-    """生成更多合成数据"""
-    print(f"\n生成 {n_synthetic} 条合成数据...")
-    
+USE_GPU = GPURandomForestClassifier is not None
+
+
+# 评估用模型：标准化 + 树模型（GPU可用时为cuML随机森林，否则为直方图梯度提升树）
+# cross_val_score 每折都会 clone，该模板本身不会被拟合，可在各增强级别间复用
+if USE_GPU:
+    MODEL_PIPELINE = make_pipeline(
+        StandardScaler(),
+        GPURandomForestClassifier(
+            n_estimators=100,
+            max_depth=5,
+            random_state=42
+        )
+    )
+else:
+    MODEL_PIPELINE = make_pipeline(
+        StandardScaler(),
+        HistGradientBoostingClassifier(
+            max_iter=100,
+            max_depth=5,
+            learning_rate=0.1,
+            random_state=42
+        )
+    )
+
+def load_processed_data(csv_path):
+    """加载处理后的数据，使用同名 .pkl 缓存避免重复解析CSV（CSV更新后缓存自动失效）"""
+    cache_path = os.path.splitext(csv_path)[0] + '.pkl'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(csv_path):
+        return pd.read_pickle(cache_path)
+    
+    df = pd.read_csv(csv_path)
+    df.to_pickle(cache_path)
+    return df
+
+
+def load_or_train_synthesizer(real_df, model_path=None):
+    """加载已训练的CTGAN模型，失败时基于真实数据重新训练"""
     if model_path:
         # 加载已训练的模型
         try:
             synthesizer = CTGANSynthesizer.load(model_path)
             print(f"✓ 加载已有CTGAN模型")
+            return synthesizer
         except:
             print(f"⚠️  无法加载模型，重新训练...")
-            model_path = None
     
-    if not model_path:
-        # 重新训练
-        print(f"训练CTGAN模型...")
-        metadata = SingleTableMetadata()
-        metadata.detect_from_dataframe(real_df)
-        
-        synthesizer = CTGANSynthesizer(
-            metadata=metadata,
-            epochs=300,
-            batch_size=100,
-            verbose=False
-        )
-        synthesizer.fit(real_df)
-        print(f"✓ 训练完成")
+    # 重新训练
+    print(f"训练CTGAN模型...")
+    metadata = SingleTableMetadata()
+    metadata.detect_from_dataframe(real_df)
+    
+    synthesizer = CTGANSynthesizer(
+        metadata=metadata,
+        epochs=300,
+        batch_size=100,
+        verbose=False
+    )
+    synthesizer.fit(real_df)
+    print(f"✓ 训练完成")
+    
+    return synthesizer
+
+
+def generate_more_synthetic_data(synthesizer, n_synthetic):
+    """使用已有的合成器生成更多合成数据"""
+    print(f"\n生成 {n_synthetic} 条合成数据...")
     
-    # 生成数据
     synthetic_df = synthesizer.sample(num_rows=n_synthetic)
     print(f"✓ 生成完成: {synthetic_df.shape}")
     
     return synthetic_df
 
 
-def create_augmented_dataset(real_df, n_synthetic):
-    """创建增强数据集：全部真实数据 + N条合成数据"""
+def create_augmented_dataset(real_df, synthetic_df):
+    """创建增强数据集：全部真实数据 + 给定的合成数据"""
+    n_synthetic = len(synthetic_df)
     print(f"\n" + "=" * 80)
     print(f"创建增强数据集: 190真实 + {n_synthetic}合成")
     print("=" * 80)
     
-    # 生成合成数据
-    synthetic_df = generate_more_synthetic_data(
-        real_df, 
-        n_synthetic,
-        model_path='saved_models/ctgan_model.pkl'
-    )
-    
-    # 合并：全部真实数据 + 合成数据
-    augmented_df = pd.concat([real_df, synthetic_df], ignore_index=True)
+    # 合并：全部真实数据 + 合成数据（保留各列原有类型，标签和计数列仍为整数；
+    # float32 转换只在 evaluate_augmented_dataset 中对特征矩阵进行）
+    augmented_df = pd.concat([real_df, synthetic_df[real_df.columns]], ignore_index=True)
     
-    # 打乱顺序
-    augmented_df = augmented_df.sample(frac=1, random_state=42).reset_index(drop=True)
+    # 打乱顺序（一次按行置换拷贝）
+    perm = np.random.default_rng(42).permutation(len(augmented_df))
+    augmented_df = augmented_df.take(perm).reset_index(drop=True)
     
     print(f"\n增强数据集:")
     print(f"  真实数据: {len(real_df)} 样本 (100%真实数据)")
@@ -84,34 +128,25 @@ def create_augmented_dataset(real_df, n_synthetic):
     return augmented_df
 
 
-def evaluate_augmented_dataset(augmented_df, dataset_name):
-    """评估增强数据集"""
+def evaluate_augmented_dataset(augmented_df, dataset_name, n_jobs=-1):
+    """评估增强数据集（n_jobs 为交叉验证的并行数）"""
     print(f"\n评估: {dataset_name}")
     
-    # 准备数据
-    X = augmented_df.drop(columns=['按方案评定级别']).values
+    # 准备数据（特征矩阵统一为float32，减半内存占用）
+    X = augmented_df.drop(columns=['按方案评定级别']).to_numpy(dtype=np.float32, copy=False)
     y = augmented_df['按方案评定级别'].values
+    if USE_GPU:
+        # cuML 分类器要求整数标签
+        y = y.astype(np.int32)
     
-    # 标准化
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-    
-    # 模型
-    model = GradientBoostingClassifier(
-        n_estimators=100,
-        max_depth=5,
-        learning_rate=0.1,
-        random_state=42
-    )
-    
-    # 交叉验证
+    # 交叉验证（标准化在每折内部拟合，避免测试折统计量泄漏）
     cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
     
     scores = cross_val_score(
-        model, X_scaled, y,
+        MODEL_PIPELINE, X, y,
         cv=cv,
         scoring='f1_weighted',
-        n_jobs=-1
+        n_jobs=n_jobs
     )
     
     mean_score = scores.mean()
@@ -135,7 +170,7 @@ def test_different_augmentation_levels():
     
     # 加载真实数据
     print("\n加载真实数据...")
-    df = pd.read_csv('data/processed/hiv_data_processed.csv')
+    df = load_processed_data('data/processed/hiv_data_processed.csv')
     
     # 准备训练数据
     exclude_columns = ['区县', 'risk_level']
@@ -152,20 +187,36 @@ def test_different_augmentation_levels():
         2000,   # 190 + 2000 = 2190
     ]
     
-    results = []
+    # 合成器只加载/训练一次，各增强级别只做采样
+    synthesizer = load_or_train_synthesizer(
+        real_df,
+        model_path='saved_models/ctgan_model.pkl'
+    )
+    
+    # 只按最大级别采样一次，各级别取其前N条
+    # （各级别不再是独立抽样，而是同一次抽样的前缀）
+    synth_max = generate_more_synthetic_data(synthesizer, max(augmentation_levels))
+    
+    # 先按顺序构建各级别数据集，再并行评估
+    datasets = []
     
     for n_synthetic in augmentation_levels:
         if n_synthetic == 0:
             # 基线：仅真实数据
             dataset_name = f"仅真实数据({len(real_df)}样本)"
-            result = evaluate_augmented_dataset(real_df, dataset_name)
+            datasets.append((real_df, dataset_name))
         else:
             # 增强数据
-            augmented_df = create_augmented_dataset(real_df, n_synthetic)
+            augmented_df = create_augmented_dataset(real_df, synth_max.iloc[:n_synthetic])
             dataset_name = f"真实+合成({len(real_df)}+{n_synthetic}={len(augmented_df)}样本)"
-            result = evaluate_augmented_dataset(augmented_df, dataset_name)
-        
-        results.append(result)
+            datasets.append((augmented_df, dataset_name))
+    
+    # 每个级别一个任务，任务内交叉验证单进程运行，避免两层并行争抢CPU
+    # （使用GPU时串行评估，避免多个进程争抢同一块显卡）
+    results = Parallel(n_jobs=1 if USE_GPU else -1, backend="loky")(
+        delayed(evaluate_augmented_dataset)(df, dataset_name, n_jobs=1)
+        for df, dataset_name in datasets
+    )
     
     # 汇总对比
     print("\n" + "=" * 80)
@@ -234,7 +285,7 @@ def test_different_augmentation_levels():
                 break
         
         if best_n_synthetic:
-            best_augmented_df = create_augmented_dataset(real_df, best_n_synthetic)
+            best_augmented_df = create_augmented_dataset(real_df, synth_max.iloc[:best_n_synthetic])
             output_path = f'data/processed/hiv_best_augmented_{len(real_df)}+{best_n_synthetic}.csv'
             best_augmented_df.to_csv(output_path, index=False, encoding='utf-8-sig')
             print(f"✓ 最佳配置数据已保存: {output_path}")
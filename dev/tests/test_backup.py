@@ -2,47 +2,98 @@
 Unit tests for the BackupService module.
 """
 
-import tempfile
+import hashlib
+import json
+import os
 import shutil
-import time
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 import pytest
 
-from reorg_tool.backup import BackupService
+from reorg_tool.backup import BackupService, CHECKSUM_MANIFEST
 from reorg_tool.exceptions import FileOperationError
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+# Sample project files: (relpath, content); __pycache__ should be ignored by backups
+TEMPLATE_FILES = (
+    ("file1.txt", b"content1"),
+    ("file2.py", b"print('hello')"),
+    ("requirements.txt", b"pytest\nchardet"),
+    ("README.md", b"# Test Project"),
+    ("subdir/file3.txt", b"content3"),
+    ("__pycache__/test.pyc", b"bytecode"),
+)
+
+
+def _fast_rmtree(path):
+    """Remove a directory tree (rm -rf where available; missing paths are ignored)."""
+    if sys.platform != 'win32':
+        subprocess.run(['rm', '-rf', os.fspath(path)], check=True)
+    else:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _iter_tree(root):
+    """Yield every DirEntry under root (scandir, inode order within a directory)."""
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            entries = sorted(it, key=lambda e: e.inode())
+        for entry in entries:
+            yield entry
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+
+
+def cow_write(path, data):
+    """
+    Overwrite a file that may be hardlinked to the shared template.
+    
+    Unlinks first so the write lands in a fresh inode instead of the template.
+    """
+    path = Path(path)
+    path.unlink()
+    path.write_text(data)
+
+
+@pytest.fixture(scope="session")
+def project_template(build_template):
+    """Build the sample project tree once per session."""
+    return build_template("backup_template", TEMPLATE_FILES)
+
 
 class TestBackupService:
     """Test cases for BackupService class."""
     
     @pytest.fixture
-    def temp_project(self):
+    def temp_project(self, project_template, tmp_path_factory, link_tree):
         """Create a temporary project for testing."""
-        temp_dir = tempfile.mkdtemp()
-        project_root = Path(temp_dir) / "test_project"
-        project_root.mkdir()
-        
-        # Create some test files
-        (project_root / "file1.txt").write_text("content1")
-        (project_root / "file2.py").write_text("print('hello')")
-        (project_root / "requirements.txt").write_text("pytest\nchardet")
-        (project_root / "README.md").write_text("# Test Project")
-        
-        # Create subdirectory
-        subdir = project_root / "subdir"
-        subdir.mkdir()
-        (subdir / "file3.txt").write_text("content3")
-        
-        # Create __pycache__ (should be ignored)
-        pycache = project_root / "__pycache__"
-        pycache.mkdir()
-        (pycache / "test.pyc").write_text("bytecode")
+        # Same base directory as the template, so hardlinks don't cross devices
+        temp_dir = tmp_path_factory.mktemp("backup", numbered=True)
+        project_root = temp_dir / "test_project"
+        # Hardlink the template files: O(files), no data copied
+        link_tree(project_template, project_root)
         
         yield str(project_root)
         
-        # Cleanup
-        shutil.rmtree(temp_dir)
+        # Cleanup (free tmpfs memory rather than waiting for basetemp rotation)
+        _fast_rmtree(temp_dir)
+    
+    @pytest.fixture
+    def remove_later(self, request):
+        """Register paths for removal at teardown, even if the test fails."""
+        def register(path):
+            request.addfinalizer(lambda: _fast_rmtree(path))
+            return path
+        return register
     
     @pytest.fixture
     def backup_service(self, temp_project):
@@ -53,6 +104,7 @@ class TestBackupService:
         """Test BackupService initialization."""
         assert backup_service is not None
         assert backup_service.project_root == Path(temp_project).resolve()
+        assert backup_service.project_root_str == str(backup_service.project_root)
         assert backup_service.backup_dir.exists()
     
     def test_backup_service_invalid_root(self):
@@ -60,88 +112,131 @@ class TestBackupService:
         with pytest.raises(FileOperationError):
             BackupService("/nonexistent/path")
     
-    def test_create_backup(self, backup_service, temp_project):
+    def test_create_backup(self, backup_service, temp_project, remove_later):
         """Test backup creation."""
-        backup_path = backup_service.create_backup()
+        bp = os.fspath(remove_later(backup_service.create_backup()))
+        join = os.path.join
         
         # Backup should exist
-        assert Path(backup_path).exists()
-        assert Path(backup_path).is_dir()
+        assert os.path.isdir(bp)
         
         # Backup should contain files
-        backup_files = list(Path(backup_path).rglob("*"))
-        assert len(backup_files) > 0
+        assert any(_iter_tree(bp))
         
         # Check specific files exist
-        assert (Path(backup_path) / "file1.txt").exists()
-        assert (Path(backup_path) / "requirements.txt").exists()
-        assert (Path(backup_path) / "README.md").exists()
+        assert os.path.isfile(join(bp, "file1.txt"))
+        assert os.path.isfile(join(bp, "requirements.txt"))
+        assert os.path.isfile(join(bp, "README.md"))
         
         # __pycache__ should be ignored
-        assert not (Path(backup_path) / "__pycache__").exists()
-        
-        # Cleanup
-        shutil.rmtree(backup_path)
+        assert not os.path.exists(join(bp, "__pycache__"))
     
-    def test_create_backup_custom_name(self, backup_service):
+    def test_create_backup_custom_name(self, backup_service, remove_later):
         """Test backup creation with custom name."""
         custom_name = "my_custom_backup"
-        backup_path = backup_service.create_backup(custom_name)
+        backup_path = remove_later(backup_service.create_backup(custom_name))
         
         assert custom_name in backup_path
         assert Path(backup_path).exists()
-        
-        # Cleanup
-        shutil.rmtree(backup_path)
     
-    def test_create_backup_duplicate_name(self, backup_service):
+    def test_create_backup_duplicate_name(self, backup_service, remove_later):
         """Test that duplicate backup names raise error."""
         backup_name = "test_backup"
-        backup_path = backup_service.create_backup(backup_name)
+        backup_path = remove_later(backup_service.create_backup(backup_name))
         
         # Try to create again with same name
         with pytest.raises(FileOperationError):
             backup_service.create_backup(backup_name)
-        
-        # Cleanup
-        shutil.rmtree(backup_path)
     
-    def test_verify_backup(self, backup_service):
+    def test_verify_backup(self, backup_service, temp_project, remove_later):
         """Test backup verification."""
-        backup_path = backup_service.create_backup()
+        backup_path = remove_later(backup_service.create_backup())
         
         # Verification should pass
         assert backup_service.verify_backup(backup_path) is True
         
-        # Cleanup
-        shutil.rmtree(backup_path)
+        # Manifest digests were taken while copying and match the source files
+        manifest = json.loads((Path(backup_path) / CHECKSUM_MANIFEST).read_text())
+        assert "subdir/file3.txt" in manifest
+        assert "__pycache__/test.pyc" not in manifest
+        for rel_path, digest in manifest.items():
+            assert backup_service.calculate_checksum(str(Path(temp_project) / rel_path)) == digest
+    
+    def test_verify_backup_detects_corruption(self, backup_service, remove_later):
+        """Test that a same-size content change fails checksum verification."""
+        backup_path = remove_later(backup_service.create_backup())
+        (Path(backup_path) / "file1.txt").write_text("CONTENT1")
+        
+        assert backup_service.verify_backup(backup_path) is False
+        assert backup_service.verify_backup(backup_path, check_checksums=False) is True
+    
+    def test_backup_independent_of_source(self, backup_service, temp_project, project_template, remove_later):
+        """Test that editing the project after a backup leaves the backup intact."""
+        backup_path = remove_later(backup_service.create_backup())
+        
+        cow_write(Path(temp_project) / "file1.txt", "changed")
+        
+        assert (Path(backup_path) / "file1.txt").read_text() == "content1"
+        assert (project_template / "file1.txt").read_text() == "content1"
     
     def test_verify_nonexistent_backup(self, backup_service):
         """Test verification of nonexistent backup."""
         result = backup_service.verify_backup("/nonexistent/backup")
         assert result is False
     
-    def test_calculate_checksum(self, backup_service, temp_project):
+    @pytest.mark.parametrize("algo, digest_size", [
+        ("md5", 16),
+        pytest.param("blake3", 32, marks=pytest.mark.skipif(
+            blake3 is None, reason="blake3 not installed")),
+    ])
+    # None: default path (hashlib.file_digest where available); sizes force the
+    # readinto loop, 3 bytes splits the 8-byte file across several reads
+    @pytest.mark.parametrize("buf_size", [None, 3, 4096, 1 << 20])
+    def test_calculate_checksum(self, backup_service, temp_project, monkeypatch,
+                                buf_size, algo, digest_size):
         """Test checksum calculation."""
         test_file = Path(temp_project) / "file1.txt"
-        checksum = backup_service.calculate_checksum(str(test_file))
+        if buf_size is None:
+            checksum = backup_service.calculate_checksum(str(test_file), algo=algo)
+        else:
+            monkeypatch.setattr("reorg_tool.backup._HAS_FILE_DIGEST", False)
+            checksum = backup_service.calculate_checksum(str(test_file), buf_size=buf_size, algo=algo)
+        
+        # Should return a valid hex digest (fromhex raises on any non-hex character)
+        assert len(checksum) == 2 * digest_size and len(bytes.fromhex(checksum)) == digest_size
+        hasher = blake3.blake3() if algo == "blake3" else hashlib.new(algo)
+        hasher.update(b"content1")
+        assert checksum == hasher.hexdigest()
+    
+    def test_calculate_checksum_blake3_missing(self, backup_service, temp_project, monkeypatch):
+        """Test that requesting blake3 without the package raises a clear error."""
+        monkeypatch.setattr("reorg_tool.backup.blake3", None)
+        with pytest.raises(FileOperationError, match="blake3"):
+            backup_service.calculate_checksum(str(Path(temp_project) / "file1.txt"), algo="blake3")
+    
+    @pytest.mark.skipif(shutil.which("md5sum") is None, reason="md5sum not available")
+    def test_calculate_checksum_matches_md5sum(self, backup_service, temp_project):
+        """Test checksum agrees with the md5sum command line tool."""
+        test_file = str(Path(temp_project) / "requirements.txt")
+        checksum = backup_service.calculate_checksum(test_file)
         
-        # Should return a valid MD5 hash
-        assert len(checksum) == 32
-        assert all(c in '0123456789abcdef' for c in checksum)
+        expected = subprocess.check_output(["md5sum", test_file], text=True).split()[0]
+        assert checksum == expected
     
-    def test_list_backups(self, backup_service):
+    def test_list_backups(self, backup_service, remove_later):
         """Test listing backups."""
-        # Create a couple of backups with proper naming
-        backup1 = backup_service.create_backup()  # Use default naming
-        time.sleep(1.1)  # Ensure different timestamps (need >1 second for timestamp format)
-        backup2 = backup_service.create_backup()  # Use default naming
+        # Create a couple of backups with proper naming, in parallel
+        prefix = f"{backup_service.project_root.name}_backup_"
+        names = [f"{prefix}{i}" for i in range(2)]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            created = [remove_later(p) for p in pool.map(backup_service.create_backup, names)]
         
         # List backups
         backups = backup_service.list_backups()
         
         # Should find both backups
         assert len(backups) >= 2
+        assert {str(p) for p in created} <= {b['path'] for b in backups}
         
         # Check backup info structure
         for backup in backups:
@@ -149,20 +244,36 @@ class TestBackupService:
             assert 'name' in backup
             assert 'created' in backup
             assert 'size_mb' in backup
+    
+    def test_list_backups_default_names(self, backup_service, monkeypatch, remove_later):
+        """Test default timestamped names without waiting on the real clock."""
+        ticks = iter([datetime(2024, 1, 1, 12, 0, 0), datetime(2024, 1, 1, 12, 0, 1)])
+        
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return next(ticks)
         
-        # Cleanup
-        shutil.rmtree(backup1)
-        shutil.rmtree(backup2)
+        monkeypatch.setattr("reorg_tool.backup.datetime", FakeDatetime)
+        backup1 = remove_later(backup_service.create_backup())
+        backup2 = remove_later(backup_service.create_backup())
+        
+        # Names carry the injected timestamps, so they sort in creation order
+        assert Path(backup1).name.endswith("_backup_20240101_120000")
+        assert Path(backup2).name.endswith("_backup_20240101_120001")
+        assert sorted([backup2, backup1]) == [backup1, backup2]
+        
+        names = {b['name'] for b in backup_service.list_backups()}
+        assert {Path(backup1).name, Path(backup2).name} <= names
     
-    def test_cleanup_old_backups(self, backup_service, temp_project):
+    def test_cleanup_old_backups(self, backup_service, temp_project, remove_later):
         """Test cleanup of old backups."""
         # Create a backup
-        backup_path = backup_service.create_backup()
+        backup_path = remove_later(backup_service.create_backup())
         
         # Modify its timestamp to make it old
         old_time = (datetime.now() - timedelta(days=10)).timestamp()
         Path(backup_path).touch()
-        import os
         os.utime(backup_path, (old_time, old_time))
         
         # Cleanup with 7 day retention
@@ -172,13 +283,13 @@ class TestBackupService:
         assert len(removed) > 0
         assert not Path(backup_path).exists()
     
-    def test_restore_backup(self, backup_service, temp_project):
+    def test_restore_backup(self, backup_service, temp_project, remove_later):
         """Test backup restoration."""
         # Create backup
-        backup_path = backup_service.create_backup()
+        backup_path = remove_later(backup_service.create_backup())
         
         # Create a new target directory
-        restore_target = Path(temp_project).parent / "restored_project"
+        restore_target = remove_later(Path(temp_project).parent / "restored_project")
         
         # Restore backup
         backup_service.restore_backup(backup_path, str(restore_target))
@@ -187,21 +298,15 @@ class TestBackupService:
         assert restore_target.exists()
         assert (restore_target / "file1.txt").exists()
         assert (restore_target / "requirements.txt").exists()
-        
-        # Cleanup
-        shutil.rmtree(backup_path)
-        shutil.rmtree(restore_target)
+        assert not (restore_target / CHECKSUM_MANIFEST).exists()
     
-    def test_restore_to_nonempty_directory(self, backup_service, temp_project):
+    def test_restore_to_nonempty_directory(self, backup_service, temp_project, remove_later):
         """Test that restore fails for non-empty directory."""
-        backup_path = backup_service.create_backup()
+        backup_path = remove_later(backup_service.create_backup())
         
         # Try to restore to existing non-empty directory
         with pytest.raises(FileOperationError):
             backup_service.restore_backup(backup_path, temp_project)
-        
-        # Cleanup
-        shutil.rmtree(backup_path)
 
 
 if __name__ == "__main__":
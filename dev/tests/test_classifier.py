@@ -2,6 +2,7 @@
 Unit tests for the FileClassifier module.
 """
 
+import os
 from datetime import datetime
 import pytest
 
@@ -9,271 +10,90 @@ from reorg_tool.classifier import FileClassifier
 from reorg_tool.models import FileInfo, FileCategory
 
 
+# (path, size) of the sample project files
+SAMPLE_FILES = (
+    ("api/app.py", 1024),
+    ("models/predictor.py", 2048),
+    ("models/enhanced_predictor.py", 3072),
+    ("data/processed/hiv_data_processed.csv", 10240),
+    ("requirements.txt", 512),
+    ("README.md", 2048),
+    ("DEPLOYMENT_GUIDE.md", 1536),
+    ("docs/AI_INNOVATION.md", 2560),
+    ("PROJECT_STATUS.md", 1024),
+    ("test_api.py", 1024),
+    ("evaluate_model.py", 2048),
+    ("utils/data_generator.py", 1536),
+    ("fix_bug.py", 512),
+)
+
+
+# (path, size, expected category) for the single-file classification test
+CLASSIFY_CASES = [
+    ("api/app.py", 1024, FileCategory.CORE_API),
+    ("models/predictor.py", 2048, FileCategory.CORE_MODEL),
+    ("data/processed/hiv_data_processed.csv", 10240, FileCategory.CORE_DATA),
+    ("requirements.txt", 512, FileCategory.CONFIG),
+    ("README.md", 2048, FileCategory.DOC_USER),
+    ("DEPLOYMENT_GUIDE.md", 1536, FileCategory.DOC_DEPLOYMENT),
+    ("docs/AI_INNOVATION.md", 2560, FileCategory.DOC_TECHNICAL),
+    ("PROJECT_STATUS.md", 1024, FileCategory.DOC_PROJECT),
+    ("test_api.py", 1024, FileCategory.DEV_TEST),
+    ("evaluate_model.py", 2048, FileCategory.DEV_SCRIPT),
+    ("utils/data_generator.py", 1536, FileCategory.DEV_UTIL),
+    ("fix_bug.py", 512, FileCategory.DEV_TEMP),
+]
+
+# Fixed modification time for every FileInfo (deterministic, no clock reads)
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+
+def _make(path, size, modified_time=_NOW):
+    """Build a FileInfo, deriving name and extension from the path."""
+    name = os.path.basename(path)
+    return FileInfo(
+        path=path,
+        name=name,
+        size=size,
+        extension=os.path.splitext(name)[1],
+        modified_time=modified_time
+    )
+
+
 class TestFileClassifier:
     """Test cases for FileClassifier class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def classifier(self):
-        """Create a FileClassifier instance."""
+        """Create a FileClassifier instance shared by the module (tests don't mutate it)."""
         return FileClassifier()
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_files(self):
         """Create sample file information for testing."""
-        return [
-            FileInfo(
-                path="api/app.py",
-                name="app.py",
-                size=1024,
-                extension=".py",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="models/predictor.py",
-                name="predictor.py",
-                size=2048,
-                extension=".py",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="models/enhanced_predictor.py",
-                name="enhanced_predictor.py",
-                size=3072,
-                extension=".py",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="data/processed/hiv_data_processed.csv",
-                name="hiv_data_processed.csv",
-                size=10240,
-                extension=".csv",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="requirements.txt",
-                name="requirements.txt",
-                size=512,
-                extension=".txt",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="README.md",
-                name="README.md",
-                size=2048,
-                extension=".md",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="DEPLOYMENT_GUIDE.md",
-                name="DEPLOYMENT_GUIDE.md",
-                size=1536,
-                extension=".md",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="docs/AI_INNOVATION.md",
-                name="AI_INNOVATION.md",
-                size=2560,
-                extension=".md",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="PROJECT_STATUS.md",
-                name="PROJECT_STATUS.md",
-                size=1024,
-                extension=".md",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="test_api.py",
-                name="test_api.py",
-                size=1024,
-                extension=".py",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="evaluate_model.py",
-                name="evaluate_model.py",
-                size=2048,
-                extension=".py",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="utils/data_generator.py",
-                name="data_generator.py",
-                size=1536,
-                extension=".py",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="fix_bug.py",
-                name="fix_bug.py",
-                size=512,
-                extension=".py",
-                modified_time=datetime.now()
-            ),
-        ]
+        return [_make(path, size) for path, size in SAMPLE_FILES]
     
     def test_classifier_initialization(self, classifier):
         """Test FileClassifier initialization."""
         assert classifier is not None
         assert len(classifier.classification_rules) > 0
     
-    def test_classify_core_api_file(self, classifier):
-        """Test classification of core API files."""
-        file_info = FileInfo(
-            path="api/app.py",
-            name="app.py",
-            size=1024,
-            extension=".py",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.CORE_API
-    
-    def test_classify_core_model_file(self, classifier):
-        """Test classification of core model files."""
-        file_info = FileInfo(
-            path="models/predictor.py",
-            name="predictor.py",
-            size=2048,
-            extension=".py",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.CORE_MODEL
-    
-    def test_classify_core_data_file(self, classifier):
-        """Test classification of core data files."""
-        file_info = FileInfo(
-            path="data/processed/hiv_data_processed.csv",
-            name="hiv_data_processed.csv",
-            size=10240,
-            extension=".csv",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.CORE_DATA
-    
-    def test_classify_config_file(self, classifier):
-        """Test classification of configuration files."""
-        file_info = FileInfo(
-            path="requirements.txt",
-            name="requirements.txt",
-            size=512,
-            extension=".txt",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.CONFIG
-    
-    def test_classify_user_doc_file(self, classifier):
-        """Test classification of user documentation files."""
-        file_info = FileInfo(
-            path="README.md",
-            name="README.md",
-            size=2048,
-            extension=".md",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.DOC_USER
-    
-    def test_classify_deployment_doc_file(self, classifier):
-        """Test classification of deployment documentation files."""
-        file_info = FileInfo(
-            path="DEPLOYMENT_GUIDE.md",
-            name="DEPLOYMENT_GUIDE.md",
-            size=1536,
-            extension=".md",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.DOC_DEPLOYMENT
-    
-    def test_classify_technical_doc_file(self, classifier):
-        """Test classification of technical documentation files."""
-        file_info = FileInfo(
-            path="docs/AI_INNOVATION.md",
-            name="AI_INNOVATION.md",
-            size=2560,
-            extension=".md",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.DOC_TECHNICAL
-    
-    def test_classify_project_doc_file(self, classifier):
-        """Test classification of project documentation files."""
-        file_info = FileInfo(
-            path="PROJECT_STATUS.md",
-            name="PROJECT_STATUS.md",
-            size=1024,
-            extension=".md",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.DOC_PROJECT
-    
-    def test_classify_test_file(self, classifier):
-        """Test classification of test files."""
-        file_info = FileInfo(
-            path="test_api.py",
-            name="test_api.py",
-            size=1024,
-            extension=".py",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.DEV_TEST
-    
-    def test_classify_dev_script_file(self, classifier):
-        """Test classification of development script files."""
-        file_info = FileInfo(
-            path="evaluate_model.py",
-            name="evaluate_model.py",
-            size=2048,
-            extension=".py",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.DEV_SCRIPT
-    
-    def test_classify_util_file(self, classifier):
-        """Test classification of utility files."""
-        file_info = FileInfo(
-            path="utils/data_generator.py",
-            name="data_generator.py",
-            size=1536,
-            extension=".py",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.DEV_UTIL
-    
-    def test_classify_temp_file(self, classifier):
-        """Test classification of temporary files."""
-        file_info = FileInfo(
-            path="fix_bug.py",
-            name="fix_bug.py",
-            size=512,
-            extension=".py",
-            modified_time=datetime.now()
-        )
-        
-        category = classifier.classify_file(file_info)
-        assert category == FileCategory.DEV_TEMP
+    def test_rule_patterns_precompiled(self, classifier):
+        """Test that every regex rule is compiled once at init."""
+        for rules in classifier.classification_rules.values():
+            for rule in rules:
+                for key in ('name_pattern', 'path_pattern'):
+                    if key in rule:
+                        assert rule[key] in classifier._compiled_patterns
+    
+    @pytest.mark.parametrize(
+        "path, size, expected",
+        CLASSIFY_CASES,
+        ids=[case[2].value for case in CLASSIFY_CASES],
+    )
+    def test_classify_file(self, classifier, path, size, expected):
+        """Test classification of one file per category."""
+        assert classifier.classify_file(_make(path, size)) == expected
     
     def test_classify_batch(self, classifier, sample_files):
         """Test batch classification of files."""
@@ -291,27 +111,9 @@ class TestFileClassifier:
     def test_detect_duplicates(self, classifier):
         """Test duplicate file detection."""
         files = [
-            FileInfo(
-                path="QUICK_START.md",
-                name="QUICK_START.md",
-                size=1024,
-                extension=".md",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="QUICKSTART.md",
-                name="QUICKSTART.md",
-                size=1024,
-                extension=".md",
-                modified_time=datetime.now()
-            ),
-            FileInfo(
-                path="QUICK_START_ENHANCED.md",
-                name="QUICK_START_ENHANCED.md",
-                size=1536,
-                extension=".md",
-                modified_time=datetime.now()
-            ),
+            _make("QUICK_START.md", 1024),
+            _make("QUICKSTART.md", 1024),
+            _make("QUICK_START_ENHANCED.md", 1536),
         ]
         
         duplicates = classifier.detect_duplicates(files)
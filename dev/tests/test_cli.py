@@ -3,10 +3,10 @@ Unit tests for the CLI module.
 """
 
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
+from dataclasses import dataclass
+from typing import Optional
 from unittest.mock import patch, MagicMock
+import os
 import sys
 
 from reorg_tool.cli import (
@@ -18,12 +18,17 @@ from reorg_tool.cli import (
 )
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
+@dataclass(frozen=True)
+class _Args:
+    """Plain stand-in for parsed CLI arguments."""
+    command: str = ""
+    output: Optional[str] = None
+    project_root: Optional[str] = None
+    config: Optional[str] = None
+    dry_run: bool = False
+    no_backup: bool = False
+    log: Optional[str] = None
+    backup: Optional[str] = None
 
 
 class TestCreateParser:
@@ -36,6 +41,10 @@ class TestCreateParser:
         assert parser is not None
         assert parser.prog == 'reorg'
     
+    def test_create_parser_is_cached(self):
+        """Test that the parser is built once and reused."""
+        assert create_parser() is create_parser()
+    
     def test_parser_has_subcommands(self):
         """Test that parser has all expected subcommands."""
         parser = create_parser()
@@ -109,28 +118,26 @@ class TestCreateParser:
 class TestCmdInit:
     """Test init command."""
     
-    def test_cmd_init_success(self, temp_dir, capsys):
+    def test_cmd_init_success(self, tmp_path, capsys):
         """Test successful init command."""
-        output_path = temp_dir / "test_config.yaml"
+        output_path = os.path.join(tmp_path, "test_config.yaml")
         
-        args = MagicMock()
-        args.output = str(output_path)
+        args = _Args(output=output_path)
         
         result = cmd_init(args)
         
         assert result == 0
-        assert output_path.exists()
+        assert os.path.exists(output_path)
         
         captured = capsys.readouterr()
         assert "Created default configuration file" in captured.out
     
-    def test_cmd_init_existing_file(self, temp_dir, capsys):
+    def test_cmd_init_existing_file(self, tmp_path, capsys):
         """Test init command with existing file."""
-        output_path = temp_dir / "existing.yaml"
+        output_path = tmp_path / "existing.yaml"
         output_path.write_text("existing content")
         
-        args = MagicMock()
-        args.output = str(output_path)
+        args = _Args(output=str(output_path))
         
         result = cmd_init(args)
         
@@ -143,10 +150,9 @@ class TestCmdInit:
 class TestCmdValidate:
     """Test validate command."""
     
-    def test_cmd_validate_success(self, temp_dir, capsys):
+    def test_cmd_validate_success(self, shared_empty_dir, capsys):
         """Test successful validate command."""
-        args = MagicMock()
-        args.project_root = str(temp_dir)
+        args = _Args(project_root=str(shared_empty_dir))
         
         result = cmd_validate(args)
         
@@ -157,8 +163,7 @@ class TestCmdValidate:
     
     def test_cmd_validate_nonexistent_project(self, capsys):
         """Test validate command with nonexistent project."""
-        args = MagicMock()
-        args.project_root = "/nonexistent/path"
+        args = _Args(project_root="/nonexistent/path")
         
         result = cmd_validate(args)
         
@@ -171,38 +176,43 @@ class TestCmdValidate:
 class TestCmdReport:
     """Test report command."""
     
-    def test_cmd_report_success(self, temp_dir, capsys):
+    # The report prints a whole directory tree, so its output is captured
+    # as bytes and searched without decoding
+    
+    def test_cmd_report_success(self, tmp_path, capsysbinary):
         """Test successful report command."""
         # Create some directories
-        (temp_dir / "subdir1").mkdir()
-        (temp_dir / "subdir2").mkdir()
+        (tmp_path / "subdir1").mkdir()
+        (tmp_path / "subdir2").mkdir()
         
-        args = MagicMock()
-        args.project_root = str(temp_dir)
-        args.output = None
+        args = _Args(project_root=str(tmp_path), output=None)
         
         result = cmd_report(args)
         
         assert result == 0
         
-        captured = capsys.readouterr()
-        assert "Directory Structure" in captured.out
+        captured = capsysbinary.readouterr()
+        assert b"Directory Structure" in captured.out
+        assert "└── subdir2/".encode('utf-8') in captured.out
     
-    def test_cmd_report_with_output(self, temp_dir, capsys):
+    def test_cmd_report_with_output(self, tmp_path, capsysbinary):
         """Test report command with output file."""
-        output_path = temp_dir / "report.txt"
+        output_path = tmp_path / "report.txt"
+        (tmp_path / "subdir1").mkdir()
         
-        args = MagicMock()
-        args.project_root = str(temp_dir)
-        args.output = str(output_path)
+        args = _Args(project_root=str(tmp_path), output=str(output_path))
         
         result = cmd_report(args)
         
         assert result == 0
         assert output_path.exists()
+        assert output_path.read_text(encoding='utf-8').splitlines() == [
+            f"{tmp_path.name}/",
+            "└── subdir1/",
+        ]
         
-        captured = capsys.readouterr()
-        assert "Report saved" in captured.out
+        captured = capsysbinary.readouterr()
+        assert b"Report saved" in captured.out
 
 
 class TestMain:
@@ -217,24 +227,24 @@ class TestMain:
         captured = capsys.readouterr()
         assert "usage:" in captured.out or "File Reorganization Tool" in captured.out
     
-    def test_main_init_command(self, temp_dir):
+    def test_main_init_command(self, tmp_path):
         """Test main with init command."""
-        output_path = temp_dir / "test.yaml"
+        output_path = os.path.join(tmp_path, "test.yaml")
         
-        result = main(['init', '--output', str(output_path)])
+        result = main(['init', '--output', output_path])
         
         assert result == 0
-        assert output_path.exists()
+        assert os.path.exists(output_path)
     
-    def test_main_validate_command(self, temp_dir):
+    def test_main_validate_command(self, shared_empty_dir):
         """Test main with validate command."""
-        result = main(['validate', '--project-root', str(temp_dir)])
+        result = main(['validate', '--project-root', str(shared_empty_dir)])
         
         assert result == 0
     
-    def test_main_report_command(self, temp_dir):
+    def test_main_report_command(self, shared_empty_dir):
         """Test main with report command."""
-        result = main(['report', '--project-root', str(temp_dir)])
+        result = main(['report', '--project-root', str(shared_empty_dir)])
         
         assert result == 0
     
@@ -250,13 +260,12 @@ class TestCmdReorganize:
     
     @patch('reorg_tool.cli.ReorganizationOrchestrator')
     @patch('reorg_tool.cli.ConfigLoader')
-    @patch('builtins.input', return_value='yes')
     def test_cmd_reorganize_with_confirmation(
         self,
-        mock_input,
         mock_config_loader,
         mock_orchestrator,
-        temp_dir
+        tmp_path,
+        yes_input
     ):
         """Test reorganize command with user confirmation."""
         from reorg_tool.cli import cmd_reorganize
@@ -265,7 +274,7 @@ class TestCmdReorganize:
         
         # Mock config
         mock_config = ReorgConfig(
-            project_root=str(temp_dir),
+            project_root=str(tmp_path),
             backup_enabled=True,
             dry_run=False
         )
@@ -285,16 +294,12 @@ class TestCmdReorganize:
         mock_orch_instance.execute_reorganization.return_value = mock_result
         mock_orchestrator.return_value = mock_orch_instance
         
-        args = MagicMock()
-        args.config = None
-        args.dry_run = False
-        args.no_backup = False
-        args.project_root = None
+        args = _Args(config=None, dry_run=False, no_backup=False, project_root=None)
         
         result = cmd_reorganize(args)
         
         assert result == 0
-        mock_input.assert_called_once()
+        assert len(yes_input) == 1
         mock_orch_instance.execute_reorganization.assert_called_once()
 
 
@@ -302,18 +307,17 @@ class TestCmdRollback:
     """Test rollback command."""
     
     @patch('reorg_tool.cli.RollbackService')
-    @patch('builtins.input', return_value='yes')
     def test_cmd_rollback_with_confirmation(
         self,
-        mock_input,
         mock_rollback_service,
-        temp_dir
+        tmp_path,
+        yes_input
     ):
         """Test rollback command with user confirmation."""
         from reorg_tool.cli import cmd_rollback
         
         # Create a dummy transaction log
-        log_path = temp_dir / ".reorg_transaction_log.json"
+        log_path = tmp_path / ".reorg_transaction_log.json"
         log_path.write_text('{"operations": []}')
         
         # Mock rollback result
@@ -329,13 +333,10 @@ class TestCmdRollback:
         mock_service_instance.execute_rollback.return_value = mock_result
         mock_rollback_service.return_value = mock_service_instance
         
-        args = MagicMock()
-        args.project_root = str(temp_dir)
-        args.log = str(log_path)
-        args.backup = None
+        args = _Args(project_root=str(tmp_path), log=str(log_path), backup=None)
         
         result = cmd_rollback(args)
         
         assert result == 0
-        mock_input.assert_called_once()
+        assert len(yes_input) == 1
         mock_service_instance.execute_rollback.assert_called_once()
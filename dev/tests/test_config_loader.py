@@ -2,30 +2,28 @@
 Unit tests for the configuration loader.
 """
 
+import json
+import os
+
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
 from reorg_tool.config_loader import ConfigLoader
 from reorg_tool.models import ReorgConfig
 from reorg_tool.exceptions import ReorgError
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
-
-
-@pytest.fixture
-def sample_config_file(temp_dir):
-    """Create a sample configuration file."""
-    config_content = """
+@pytest.fixture(scope="class")
+def sample_config_file(tmp_path_factory):
+    """Create a sample configuration file (shared per class; tests must not modify it)."""
+    base_dir = str(tmp_path_factory.mktemp("sample_config"))
+    
+    # Create a dummy project root
+    project_root = os.path.join(base_dir, "project")
+    os.mkdir(project_root)
+    
+    config_content = f"""
 reorganization:
-  project_root: "."
+  project_root: "{project_root}"
   backup:
     enabled: true
     retention_days: 7
@@ -35,12 +33,9 @@ reorganization:
   logging:
     level: "INFO"
 """
-    config_path = temp_dir / "test_config.yaml"
-    config_path.write_text(config_content)
-    
-    # Create a dummy project root
-    project_root = temp_dir / "project"
-    project_root.mkdir()
+    config_path = os.path.join(base_dir, "test_config.yaml")
+    with open(config_path, 'w', encoding='utf-8') as f:
+        f.write(config_content)
     
     return config_path
 
@@ -48,37 +43,22 @@ reorganization:
 class TestLoadConfig:
     """Test configuration loading."""
     
-    def test_load_config_from_file(self, sample_config_file, temp_dir):
+    def test_load_config_from_file(self, sample_config_file):
         """Test loading configuration from file."""
-        # Update config to use temp project root
-        config_content = f"""
-reorganization:
-  project_root: "{temp_dir / 'project'}"
-  backup:
-    enabled: true
-  dry_run: false
-"""
-        sample_config_file.write_text(config_content)
-        
-        config = ConfigLoader.load_config(str(sample_config_file))
+        config = ConfigLoader.load_config(sample_config_file)
         
         assert isinstance(config, ReorgConfig)
         assert config.backup_enabled is True
         assert config.dry_run is False
     
-    def test_load_config_without_file(self, temp_dir):
+    def test_load_config_without_file(self, tmp_path, monkeypatch):
         """Test loading default configuration."""
         # Change to temp dir so default "." works
-        import os
-        original_dir = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            config = ConfigLoader.load_config()
-            
-            assert isinstance(config, ReorgConfig)
-            assert config.backup_enabled is True
-        finally:
-            os.chdir(original_dir)
+        monkeypatch.chdir(tmp_path)
+        config = ConfigLoader.load_config()
+        
+        assert isinstance(config, ReorgConfig)
+        assert config.backup_enabled is True
     
     def test_load_config_nonexistent_file(self):
         """Test loading from nonexistent file."""
@@ -87,9 +67,9 @@ reorganization:
         
         assert "not found" in str(exc_info.value)
     
-    def test_load_config_invalid_yaml(self, temp_dir):
+    def test_load_config_invalid_yaml(self, tmp_path):
         """Test loading invalid YAML."""
-        invalid_config = temp_dir / "invalid.yaml"
+        invalid_config = tmp_path / "invalid.yaml"
         invalid_config.write_text("invalid: yaml: content: [")
         
         with pytest.raises(ReorgError) as exc_info:
@@ -97,29 +77,99 @@ reorganization:
         
         assert "Invalid YAML" in str(exc_info.value)
     
-    def test_load_config_empty_file(self, temp_dir):
+    def test_load_yaml_cached_until_file_changes(self, tmp_path):
+        """Test that parsed YAML is reused until the file changes."""
+        config_path = tmp_path / "cached.yaml"
+        config_path.write_text("reorganization:\n  dry_run: false\n")
+        
+        first = ConfigLoader._load_yaml(str(config_path))
+        first['reorganization']['dry_run'] = 'mutated'
+        
+        # Callers get their own copy, so mutations don't leak into the cache
+        assert ConfigLoader._load_yaml(str(config_path))['reorganization']['dry_run'] is False
+        
+        # Rewriting the file (different size) invalidates the cached entry
+        config_path.write_text("reorganization:\n  dry_run: true\n  extra: 1\n")
+        assert ConfigLoader._load_yaml(str(config_path))['reorganization']['dry_run'] is True
+    
+    def test_load_config_empty_file(self, tmp_path, monkeypatch):
         """Test loading empty configuration file."""
-        empty_config = temp_dir / "empty.yaml"
+        empty_config = tmp_path / "empty.yaml"
         empty_config.write_text("")
         
         # Should use defaults
-        import os
-        original_dir = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            config = ConfigLoader.load_config(str(empty_config))
-            assert isinstance(config, ReorgConfig)
-        finally:
-            os.chdir(original_dir)
+        monkeypatch.chdir(tmp_path)
+        config = ConfigLoader.load_config(str(empty_config))
+        assert isinstance(config, ReorgConfig)
+    
+    def test_load_config_from_json(self, tmp_path):
+        """Test loading a JSON configuration file."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(
+            {"reorganization": {"project_root": str(tmp_path), "dry_run": True}}
+        ))
+        
+        config = ConfigLoader.load_config(str(config_path))
+        assert config.project_root == str(tmp_path)
+        assert config.dry_run is True
+    
+    def test_load_config_invalid_json(self, tmp_path):
+        """Test loading invalid JSON."""
+        invalid_config = tmp_path / "invalid.json"
+        invalid_config.write_text('{"reorganization": ')
+        
+        with pytest.raises(ReorgError) as exc_info:
+            ConfigLoader.load_config(str(invalid_config))
+        
+        assert "Invalid JSON" in str(exc_info.value)
+    
+    def test_cached_json_used_while_fresh(self, tmp_path):
+        """Test that a JSON copy is preferred until the YAML file changes."""
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("reorganization:\n  dry_run: false\n")
+        
+        json_path = ConfigLoader.create_cached_json(str(yaml_path))
+        assert json_path == str(tmp_path / "config.yaml.cache.json")
+        assert ConfigLoader._load_yaml(str(yaml_path)) == {'reorganization': {'dry_run': False}}
+        
+        # Tamper with the copy to prove it is the file being read
+        with open(json_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        cached['config']['reorganization']['dry_run'] = "from-json"
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(cached, f)
+        ConfigLoader.clear_cache()
+        assert ConfigLoader._load_yaml(str(yaml_path))['reorganization']['dry_run'] == "from-json"
+        
+        # Modifying the YAML file makes the JSON copy stale
+        yaml_mtime = os.stat(yaml_path).st_mtime_ns
+        os.utime(yaml_path, ns=(yaml_mtime + 10**9, yaml_mtime + 10**9))
+        assert ConfigLoader._load_yaml(str(yaml_path))['reorganization']['dry_run'] is False
+    
+    def test_unrelated_json_sibling_ignored(self, tmp_path):
+        """Test that a config.json next to config.yaml does not replace it."""
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("reorganization:\n  dry_run: false\n")
+        (tmp_path / "config.json").write_text('{"reorganization": {"dry_run": true}}')
+        
+        # Even a newer file with the cache suffix is ignored without a matching source stamp
+        (tmp_path / "config.yaml.cache.json").write_text('{"reorganization": {"dry_run": true}}')
+        
+        assert ConfigLoader._load_yaml(str(yaml_path)) == {'reorganization': {'dry_run': False}}
+    
+    def test_create_cached_json_rejects_json(self, tmp_path):
+        """Test that a JSON file cannot be converted to itself."""
+        with pytest.raises(ReorgError):
+            ConfigLoader.create_cached_json(str(tmp_path / "config.json"))
 
 
 class TestValidateConfig:
     """Test configuration validation."""
     
-    def test_validate_valid_config(self, temp_dir):
+    def test_validate_valid_config(self, shared_empty_dir):
         """Test validating valid configuration."""
         config = ReorgConfig(
-            project_root=str(temp_dir),
+            project_root=str(shared_empty_dir),
             backup_enabled=True,
         )
         
@@ -149,10 +199,17 @@ class TestValidateConfig:
         
         assert "does not exist" in str(exc_info.value)
     
-    def test_validate_invalid_log_level(self, temp_dir):
+    def test_construction_skips_existence_check(self):
+        """Test that building a config never checks project_root on disk."""
+        # Must not raise: existence is ConfigLoader.validate_config's job
+        config = ReorgConfig(project_root="/nonexistent/path", dry_run=True)
+        
+        assert config.project_root
+    
+    def test_validate_invalid_log_level(self, shared_empty_dir):
         """Test validation with invalid log level."""
         config = ReorgConfig(
-            project_root=str(temp_dir),
+            project_root=str(shared_empty_dir),
             log_level="INVALID",
         )
         
@@ -161,39 +218,60 @@ class TestValidateConfig:
         
         assert "invalid log_level" in str(exc_info.value)
     
-    def test_validate_valid_log_levels(self, temp_dir):
+    def test_validate_valid_log_levels(self, shared_empty_dir):
         """Test validation with all valid log levels."""
         valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
         
         for level in valid_levels:
             config = ReorgConfig(
-                project_root=str(temp_dir),
+                project_root=str(shared_empty_dir),
                 log_level=level,
             )
             assert ConfigLoader.validate_config(config) is True
+    
+    def test_validate_root_checked_once(self, shared_empty_dir, monkeypatch):
+        """Test that repeated validations of the same root stat it only once."""
+        calls = []
+        real_exists = os.path.exists
+        
+        def counting_exists(path):
+            calls.append(path)
+            return real_exists(path)
+        
+        monkeypatch.setattr(os.path, "exists", counting_exists)
+        
+        for level in ('DEBUG', 'INFO', 'WARNING'):
+            config = ReorgConfig(project_root=str(shared_empty_dir), log_level=level)
+            ConfigLoader.validate_config(config)
+        
+        assert calls == [str(shared_empty_dir)]
 
 
 class TestCreateDefaultConfig:
     """Test default configuration creation."""
     
-    def test_create_default_config(self, temp_dir):
+    def test_create_default_config(self, tmp_path):
         """Test creating default configuration file."""
-        output_path = temp_dir / "default_config.yaml"
+        output_path = os.path.join(tmp_path, "default_config.yaml")
         
-        result_path = ConfigLoader.create_default_config(str(output_path))
+        result_path = ConfigLoader.create_default_config(output_path)
         
-        assert result_path == str(output_path)
-        assert output_path.exists()
+        assert result_path == output_path
+        assert os.path.exists(output_path)
         
         # Verify content
-        content = output_path.read_text()
+        with open(output_path, encoding='utf-8') as f:
+            content = f.read()
         assert "reorganization:" in content
         assert "backup:" in content
         assert "symbolic_links:" in content
+        
+        # The template is written verbatim (comments included), not re-dumped
+        assert content == ConfigLoader.get_config_template()
     
-    def test_create_default_config_existing_file(self, temp_dir):
+    def test_create_default_config_existing_file(self, tmp_path):
         """Test creating config when file already exists."""
-        output_path = temp_dir / "existing.yaml"
+        output_path = tmp_path / "existing.yaml"
         output_path.write_text("existing content")
         
         with pytest.raises(ReorgError) as exc_info:
@@ -201,14 +279,13 @@ class TestCreateDefaultConfig:
         
         assert "already exists" in str(exc_info.value)
     
-    def test_create_default_config_creates_directory(self, temp_dir):
+    def test_create_default_config_creates_directory(self, tmp_path):
         """Test that parent directories are created."""
-        output_path = temp_dir / "subdir" / "config.yaml"
+        output_path = os.path.join(tmp_path, "subdir", "config.yaml")
         
-        ConfigLoader.create_default_config(str(output_path))
+        ConfigLoader.create_default_config(output_path)
         
-        assert output_path.exists()
-        assert output_path.parent.exists()
+        assert os.path.isfile(output_path)
 
 
 class TestMergeConfigs:
@@ -246,6 +323,17 @@ class TestMergeConfigs:
         assert merged['reorganization']['backup']['retention_days'] == 7
         assert merged['reorganization']['dry_run'] is True
     
+    def test_merge_does_not_mutate_inputs(self):
+        """Test that merging leaves both inputs untouched."""
+        base = {'reorganization': {'backup': {'enabled': True}}}
+        override = {'reorganization': {'backup': {'enabled': False}, 'extra': {'x': 1}}}
+        
+        merged = ConfigLoader.merge_configs(base, override)
+        merged['reorganization']['extra']['x'] = 2
+        
+        assert base == {'reorganization': {'backup': {'enabled': True}}}
+        assert override['reorganization']['extra'] == {'x': 1}
+    
     def test_merge_empty_override(self):
         """Test merging with empty override."""
         base = {'a': 1, 'b': 2}
@@ -268,18 +356,8 @@ class TestMergeConfigs:
 class TestLoadConfigWithOverrides:
     """Test loading configuration with overrides."""
     
-    def test_load_with_overrides(self, sample_config_file, temp_dir):
+    def test_load_with_overrides(self, sample_config_file):
         """Test loading config with command-line overrides."""
-        # Update config to use temp project root
-        config_content = f"""
-reorganization:
-  project_root: "{temp_dir / 'project'}"
-  dry_run: false
-  backup:
-    enabled: true
-"""
-        sample_config_file.write_text(config_content)
-        
         overrides = {
             'reorganization': {
                 'dry_run': True,
@@ -287,44 +365,32 @@ reorganization:
         }
         
         config = ConfigLoader.load_config_with_overrides(
-            str(sample_config_file),
+            sample_config_file,
             overrides
         )
         
         assert config.dry_run is True  # Overridden
         assert config.backup_enabled is True  # From file
     
-    def test_load_with_no_overrides(self, sample_config_file, temp_dir):
+    def test_load_with_no_overrides(self, sample_config_file):
         """Test loading config without overrides."""
-        config_content = f"""
-reorganization:
-  project_root: "{temp_dir / 'project'}"
-  dry_run: false
-"""
-        sample_config_file.write_text(config_content)
-        
-        config = ConfigLoader.load_config_with_overrides(str(sample_config_file))
+        config = ConfigLoader.load_config_with_overrides(sample_config_file)
         
         assert config.dry_run is False
     
-    def test_load_defaults_with_overrides(self, temp_dir):
+    def test_load_defaults_with_overrides(self, tmp_path, monkeypatch):
         """Test loading defaults with overrides."""
-        import os
-        original_dir = os.getcwd()
-        try:
-            os.chdir(temp_dir)
-            
-            overrides = {
-                'reorganization': {
-                    'dry_run': True,
-                }
+        monkeypatch.chdir(tmp_path)
+        
+        overrides = {
+            'reorganization': {
+                'dry_run': True,
             }
-            
-            config = ConfigLoader.load_config_with_overrides(None, overrides)
-            
-            assert config.dry_run is True
-        finally:
-            os.chdir(original_dir)
+        }
+        
+        config = ConfigLoader.load_config_with_overrides(None, overrides)
+        
+        assert config.dry_run is True
 
 
 class TestGetConfigTemplate:
@@ -346,8 +412,9 @@ class TestGetConfigTemplate:
         
         template = ConfigLoader.get_config_template()
         
-        # Should not raise exception
-        config_dict = yaml.safe_load(template)
+        # Should not raise exception (libyaml's C loader when available)
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        config_dict = yaml.load(template, Loader=loader)
         assert isinstance(config_dict, dict)
         assert 'reorganization' in config_dict
 
@@ -355,11 +422,11 @@ class TestGetConfigTemplate:
 class TestConfigurationFields:
     """Test that all configuration fields are properly loaded."""
     
-    def test_all_fields_loaded(self, temp_dir):
+    def test_all_fields_loaded(self, tmp_path):
         """Test that all configuration fields are loaded correctly."""
         config_content = f"""
 reorganization:
-  project_root: "{temp_dir}"
+  project_root: "{tmp_path}"
   backup:
     enabled: false
     path: "/custom/backup"
@@ -373,12 +440,12 @@ reorganization:
   logging:
     level: "DEBUG"
 """
-        config_path = temp_dir / "full_config.yaml"
+        config_path = tmp_path / "full_config.yaml"
         config_path.write_text(config_content)
         
         config = ConfigLoader.load_config(str(config_path))
         
-        assert str(config.project_root) == str(temp_dir)
+        assert str(config.project_root) == str(tmp_path)
         assert config.backup_enabled is False
         assert config.backup_path == "/custom/backup"
         assert config.create_symbolic_links is False
@@ -5,22 +5,21 @@
 
 import sys
 import os
+from pathlib import Path
+
+import pytest
 
 # 添加项目根目录到Python路径
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, project_root)
 
-from models.enhanced_predictor import EnhancedPredictor
-
-# 初始化增强预测器
-print("="*60)
-print("测试增强预测器的特征贡献度功能")
-print("="*60)
+MODEL_PATH = 'saved_models/final_model_3to5.pkl'
 
-predictor = EnhancedPredictor('saved_models/final_model_3to5.pkl')
+# 没有模型文件（如CI环境）时跳过，而不是在收集阶段报错
+pytestmark = pytest.mark.skipif(not Path(MODEL_PATH).exists(), reason="model artifact absent")
 
 # 测试数据
-features = {
+FEATURES = {
     '存活数': 1200,
     '感染率': 0.12,
     '治疗覆盖率': 92.0,
@@ -28,57 +27,48 @@ features = {
     '人口数': 600000
 }
 
-print("\n测试1: 基础预测（不含特征贡献度）")
-print("-"*60)
-result1 = predictor.predict_single(features, include_contributions=False)
-print(f"风险等级: {result1['risk_level_5']} - {result1['risk_description']}")
-print(f"风险分数: {result1['risk_score']:.2f}")
-print(f"特征贡献度: {result1.get('feature_contributions', '未请求')}")
-
-print("\n测试2: 增强预测（含特征贡献度）")
-print("-"*60)
-result2 = predictor.predict_single(features, include_contributions=True)
-print(f"风险等级: {result2['risk_level_5']} - {result2['risk_description']}")
-print(f"风险分数: {result2['risk_score']:.2f}")
-
-if result2.get('feature_contributions'):
-    contrib = result2['feature_contributions']
-    print(f"\n特征贡献度分析:")
-    print(f"  基准值: {contrib['base_value']:.4f}")
-    print(f"  预测值: {contrib['prediction']:.4f}")
-    
-    print(f"\n  Top 5 正贡献特征（增加风险）:")
-    for f in contrib['top_positive']:
-        print(f"    {f['feature']:30s}: {f['value']:8.2f} → +{f['contribution']:7.4f}")
-    
-    print(f"\n  Top 5 负贡献特征（降低风险）:")
-    for f in contrib['top_negative']:
-        print(f"    {f['feature']:30s}: {f['value']:8.2f} → {f['contribution']:7.4f}")
-else:
-    print("❌ 特征贡献度为空")
-
-print("\n测试3: 完整增强预测（含注意力权重）")
-print("-"*60)
-result3 = predictor.predict_single(features, return_attention=True, include_contributions=True)
-print(f"风险等级: {result3['risk_level_5']} - {result3['risk_description']}")
-print(f"风险分数: {result3['risk_score']:.2f}")
-
-if result3.get('attention_weights'):
-    print(f"\n注意力权重（Top 10特征）:")
-    attn_weights = result3['attention_weights']
-    
-    # 使用正确的键名 'top_10_features'
-    if 'top_10_features' in attn_weights:
-        for item in attn_weights['top_10_features'][:5]:
-            print(f"  {item['feature']:30s}: 权重 {item['weight']:.4f}")
-    else:
-        print(f"  ⚠️ 注意力权重格式不符合预期，可用键: {list(attn_weights.keys())}")
-
-if result3.get('feature_contributions'):
-    print(f"\n✓ 特征贡献度已包含")
-else:
-    print(f"\n❌ 特征贡献度为空")
-
-print("\n" + "="*60)
-print("测试完成")
-print("="*60)
+
+@pytest.fixture(scope="module")
+def predictor():
+    """增强预测器（每个模块只加载一次，且只在测试被选中时加载）"""
+    from models.enhanced_predictor import EnhancedPredictor
+    return EnhancedPredictor(MODEL_PATH)
+
+
+@pytest.fixture(scope="module")
+def full_result(predictor):
+    """一次完整预测（同时含注意力权重和特征贡献度），三个测试各取所需部分"""
+    return predictor.predict_single(FEATURES, return_attention=True, include_contributions=True)
+
+
+def test_basic_prediction(full_result):
+    """测试1: 基础预测字段"""
+    assert full_result['risk_level_5'] is not None
+    assert full_result['risk_description']
+    assert 'risk_score' in full_result
+
+
+def test_contributions(full_result):
+    """测试2: 特征贡献度"""
+    contrib = full_result.get('feature_contributions')
+    assert contrib, "特征贡献度为空"
+    assert 'base_value' in contrib and 'prediction' in contrib
+    assert contrib['top_positive']
+    for f in contrib['top_positive'] + contrib['top_negative']:
+        assert {'feature', 'value', 'contribution'} <= f.keys()
+
+
+def test_attention(predictor, full_result):
+    """测试3: 注意力权重"""
+    if not predictor.enable_attention:
+        pytest.skip("模型未启用注意力机制")
+
+    attn_weights = full_result.get('attention_weights')
+    assert attn_weights, "注意力权重为空"
+    assert 'top_10_features' in attn_weights, f"注意力权重格式不符合预期，可用键: {list(attn_weights.keys())}"
+    assert all('weight' in item for item in attn_weights['top_10_features'])
+    assert full_result.get('feature_contributions'), "特征贡献度为空"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -3,41 +3,52 @@ Unit tests for the symbolic linker module.
 """
 
 import os
+import stat
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
-from reorg_tool.linker import SymbolicLinker
+from reorg_tool.linker import SymbolicLinker, _relpath_cached
 from reorg_tool.transaction_log import TransactionLog
 from reorg_tool.exceptions import FileOperationError
 
 
+# Sample project files whose content is read back: (relpath, content)
+CONTENT_FILES = (
+    ("file1.txt", b"content1"),
+)
+
+# Sample project files that only need to exist (created empty)
+TOUCH_FILES = (
+    "file2.txt",
+    "subdir1/file3.txt",
+    "subdir2/nested/file4.txt",
+)
+
+
+# Link and target names shared by the verify/get-target tests
+LINK = "link.txt"
+FILE1 = "file1.txt"
+
+
+def assert_symlink(path):
+    """Assert that path is a symlink itself (a single lstat, link not followed)."""
+    assert stat.S_ISLNK(os.lstat(path).st_mode), f"not a symlink: {path}"
+
+
+@pytest.fixture(scope="module")
+def _template_project(build_template):
+    """Build the sample project tree once per module (read-only)."""
+    return build_template("linker_template", CONTENT_FILES, TOUCH_FILES)
+
+
 @pytest.fixture
-def temp_project():
-    """Create a temporary project directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    
-    # Create test directory structure
-    project_root = Path(temp_dir) / "test_project"
-    project_root.mkdir()
-    
-    # Create some test files
-    (project_root / "file1.txt").write_text("content1")
-    (project_root / "file2.txt").write_text("content2")
-    
-    # Create subdirectories
-    (project_root / "subdir1").mkdir()
-    (project_root / "subdir1" / "file3.txt").write_text("content3")
-    
-    (project_root / "subdir2").mkdir()
-    (project_root / "subdir2" / "nested").mkdir()
-    (project_root / "subdir2" / "nested" / "file4.txt").write_text("content4")
-    
-    yield project_root
-    
-    # Cleanup
-    shutil.rmtree(temp_dir)
+def temp_project(tmp_path, _template_project, link_tree):
+    """
+    Create a temporary project directory for testing.
+    
+    Files are hardlinked from the template; tests may unlink or replace
+    them but must not write into them in place.
+    """
+    return link_tree(_template_project, tmp_path / "test_project")
 
 
 @pytest.fixture
@@ -46,14 +57,30 @@ def linker(temp_project):
     return SymbolicLinker(str(temp_project))
 
 
+@pytest.fixture(scope="class")
+def pure_linker(shared_empty_dir):
+    """A SymbolicLinker shared by a class whose tests never touch the filesystem."""
+    return SymbolicLinker(str(shared_empty_dir))
+
+
 @pytest.fixture
-def linker_with_log(temp_project):
-    """Create a SymbolicLinker with transaction log."""
-    log_path = temp_project / ".reorg_transaction_log.json"
-    transaction_log = TransactionLog(str(log_path))
+def linker_with_log(temp_project, tmp_path):
+    """Create a SymbolicLinker with an in-memory transaction log."""
+    log_path = tmp_path / ".reorg_transaction_log.json"
+    transaction_log = TransactionLog(str(log_path), autosave=False)
     return SymbolicLinker(str(temp_project), transaction_log)
 
 
+@pytest.fixture
+def make_links(linker):
+    """Create several (link_path, target_path) links with one batch call."""
+    def _make(*pairs):
+        result = linker.create_batch_links(list(pairs))
+        assert result['failed'] == 0, result['errors']
+        return result
+    return _make
+
+
 class TestSymbolicLinkerInit:
     """Test SymbolicLinker initialization."""
     
@@ -79,36 +106,44 @@ class TestSymbolicLinkerInit:
 class TestCalculateRelativePath:
     """Test relative path calculation."""
     
-    def test_same_directory(self, linker):
+    def test_same_directory(self, pure_linker):
         """Test relative path for files in same directory."""
-        relative = linker.calculate_relative_path("link.txt", "file1.txt")
+        relative = pure_linker.calculate_relative_path("link.txt", "file1.txt")
         assert relative == "file1.txt"
     
-    def test_subdirectory_to_root(self, linker):
+    def test_subdirectory_to_root(self, pure_linker):
         """Test relative path from subdirectory to root."""
-        relative = linker.calculate_relative_path("subdir1/link.txt", "file1.txt")
+        relative = pure_linker.calculate_relative_path("subdir1/link.txt", "file1.txt")
         assert relative == "../file1.txt"
     
-    def test_root_to_subdirectory(self, linker):
+    def test_root_to_subdirectory(self, pure_linker):
         """Test relative path from root to subdirectory."""
-        relative = linker.calculate_relative_path("link.txt", "subdir1/file3.txt")
+        relative = pure_linker.calculate_relative_path("link.txt", "subdir1/file3.txt")
         assert relative == "subdir1/file3.txt"
     
-    def test_between_subdirectories(self, linker):
+    def test_between_subdirectories(self, pure_linker):
         """Test relative path between different subdirectories."""
-        relative = linker.calculate_relative_path(
+        relative = pure_linker.calculate_relative_path(
             "subdir1/link.txt",
             "subdir2/nested/file4.txt"
         )
         assert relative == "../subdir2/nested/file4.txt"
     
-    def test_nested_to_nested(self, linker):
+    def test_nested_to_nested(self, pure_linker):
         """Test relative path between nested directories."""
-        relative = linker.calculate_relative_path(
+        relative = pure_linker.calculate_relative_path(
             "subdir2/nested/link.txt",
             "subdir1/file3.txt"
         )
         assert relative == "../../subdir1/file3.txt"
+    
+    def test_repeated_calls_are_cached(self, pure_linker):
+        """Test that repeated lookups for the same pair are served from cache."""
+        pure_linker.calculate_relative_path("subdir1/cached.txt", "file1.txt")
+        hits = _relpath_cached.cache_info().hits
+        
+        assert pure_linker.calculate_relative_path("subdir1/cached.txt", "file1.txt") == "../file1.txt"
+        assert _relpath_cached.cache_info().hits == hits + 1
 
 
 class TestCreateLink:
@@ -118,14 +153,16 @@ class TestCreateLink:
         """Test creating a simple symbolic link."""
         result = linker.create_link("link_to_file1.txt", "file1.txt")
         
-        assert result['success'] is True
-        assert result['link_path'] == "link_to_file1.txt"
-        assert result['target_path'] == "file1.txt"
-        assert result['relative_path'] == "file1.txt"
+        assert result == {
+            'success': True,
+            'link_path': "link_to_file1.txt",
+            'target_path': "file1.txt",
+            'relative_path': "file1.txt",
+        }
         
         # Verify link exists
         link_path = linker.project_root / "link_to_file1.txt"
-        assert link_path.is_symlink()
+        assert_symlink(link_path)
         assert link_path.read_text() == "content1"
     
     def test_create_link_to_subdirectory_file(self, linker):
@@ -136,8 +173,8 @@ class TestCreateLink:
         assert result['relative_path'] == "subdir1/file3.txt"
         
         link_path = linker.project_root / "link.txt"
-        assert link_path.is_symlink()
-        assert link_path.read_text() == "content3"
+        assert_symlink(link_path)
+        assert os.readlink(link_path) == result['relative_path']
     
     def test_create_link_in_subdirectory(self, linker):
         """Test creating link inside a subdirectory."""
@@ -147,8 +184,8 @@ class TestCreateLink:
         assert result['relative_path'] == "../file1.txt"
         
         link_path = linker.project_root / "subdir1" / "link.txt"
-        assert link_path.is_symlink()
-        assert link_path.read_text() == "content1"
+        assert_symlink(link_path)
+        assert os.readlink(link_path) == result['relative_path']
     
     def test_create_link_creates_parent_directory(self, linker):
         """Test that parent directories are created if needed."""
@@ -157,7 +194,7 @@ class TestCreateLink:
         assert result['success'] is True
         
         link_path = linker.project_root / "newdir" / "link.txt"
-        assert link_path.is_symlink()
+        assert_symlink(link_path)
         assert link_path.parent.exists()
     
     def test_create_link_to_nonexistent_target(self, linker):
@@ -174,6 +211,15 @@ class TestCreateLink:
         
         assert "already exists" in str(exc_info.value)
     
+    def test_create_link_at_dangling_link(self, linker):
+        """Test creating link where a broken link already sits fails."""
+        os.symlink("missing.txt", linker.project_root / "link.txt")
+        
+        with pytest.raises(FileOperationError) as exc_info:
+            linker.create_link("link.txt", "file1.txt")
+        
+        assert "already exists" in str(exc_info.value)
+    
     def test_create_link_logs_to_transaction_log(self, linker_with_log):
         """Test that link creation is logged."""
         linker_with_log.create_link("link.txt", "file1.txt")
@@ -200,8 +246,8 @@ class TestVerifyLink:
     
     def test_verify_valid_link(self, linker):
         """Test verifying a valid symbolic link."""
-        linker.create_link("link.txt", "file1.txt")
-        assert linker.verify_link("link.txt") is True
+        linker.create_link(LINK, FILE1)
+        assert linker.verify_link(LINK) is True
     
     def test_verify_nonexistent_link(self, linker):
         """Test verifying nonexistent link returns False."""
@@ -209,18 +255,18 @@ class TestVerifyLink:
     
     def test_verify_regular_file(self, linker):
         """Test verifying regular file returns False."""
-        assert linker.verify_link("file1.txt") is False
+        assert linker.verify_link(FILE1) is False
     
     def test_verify_broken_link(self, linker):
         """Test verifying broken link returns False."""
         # Create a link
-        linker.create_link("link.txt", "file1.txt")
+        linker.create_link(LINK, FILE1)
         
         # Remove the target
-        (linker.project_root / "file1.txt").unlink()
+        (linker.project_root / FILE1).unlink()
         
         # Verify should fail
-        assert linker.verify_link("link.txt") is False
+        assert linker.verify_link(LINK) is False
     
     def test_verify_link_to_directory(self, linker):
         """Test verifying link to directory."""
@@ -281,15 +327,15 @@ class TestGetLinkTarget:
     
     def test_get_target_of_valid_link(self, linker):
         """Test getting target of valid link."""
-        linker.create_link("link.txt", "file1.txt")
-        target = linker.get_link_target("link.txt")
-        assert target == "file1.txt"
+        linker.create_link(LINK, FILE1)
+        target = linker.get_link_target(LINK)
+        assert target == FILE1
     
     def test_get_target_of_nested_link(self, linker):
         """Test getting target of link in subdirectory."""
-        linker.create_link("subdir1/link.txt", "file1.txt")
+        linker.create_link("subdir1/link.txt", FILE1)
         target = linker.get_link_target("subdir1/link.txt")
-        assert target == "file1.txt"
+        assert target == FILE1
     
     def test_get_target_of_nonexistent_link(self, linker):
         """Test getting target of nonexistent link returns None."""
@@ -298,7 +344,7 @@ class TestGetLinkTarget:
     
     def test_get_target_of_regular_file(self, linker):
         """Test getting target of regular file returns None."""
-        target = linker.get_link_target("file1.txt")
+        target = linker.get_link_target(FILE1)
         assert target is None
 
 
@@ -310,9 +356,9 @@ class TestRemoveLink:
         linker.create_link("link.txt", "file1.txt")
         assert linker.remove_link("link.txt") is True
         
-        # Verify link is gone
+        # Verify link is gone (lexists: the link itself, not its target)
         link_path = linker.project_root / "link.txt"
-        assert not link_path.exists()
+        assert not os.path.lexists(link_path)
         
         # Verify target still exists
         assert (linker.project_root / "file1.txt").exists()
@@ -329,10 +375,9 @@ class TestRemoveLink:
 class TestListLinks:
     """Test listing symbolic links."""
     
-    def test_list_links_in_root(self, linker):
+    def test_list_links_in_root(self, linker, make_links):
         """Test listing links in root directory."""
-        linker.create_link("link1.txt", "file1.txt")
-        linker.create_link("link2.txt", "file2.txt")
+        make_links(("link1.txt", "file1.txt"), ("link2.txt", "file2.txt"))
         
         links = linker.list_links()
         
@@ -341,16 +386,23 @@ class TestListLinks:
         assert "link1.txt" in link_paths
         assert "link2.txt" in link_paths
     
-    def test_list_links_in_subdirectory(self, linker):
+    def test_list_links_in_subdirectory(self, linker, make_links):
         """Test listing links in specific subdirectory."""
-        linker.create_link("subdir1/link.txt", "file1.txt")
-        linker.create_link("link.txt", "file2.txt")
+        make_links(("subdir1/link.txt", "file1.txt"), ("link.txt", "file2.txt"))
         
         links = linker.list_links("subdir1")
         
         assert len(links) == 1
         assert links[0]['link_path'] == "subdir1/link.txt"
     
+    def test_list_links_does_not_follow_directory_links(self, linker, make_links):
+        """Test that links found through a linked directory are not listed twice."""
+        make_links(("subdir2/nested/link.txt", "file1.txt"), ("link_dir", "subdir2"))
+        
+        link_paths = sorted(link['link_path'] for link in linker.list_links())
+        
+        assert link_paths == ["link_dir", os.path.join("subdir2", "nested", "link.txt")]
+    
     def test_list_links_includes_validity(self, linker):
         """Test that list includes validity information."""
         linker.create_link("link.txt", "file1.txt")
@@ -370,10 +422,9 @@ class TestListLinks:
 class TestVerifyAllLinks:
     """Test verifying all links."""
     
-    def test_verify_all_valid_links(self, linker):
+    def test_verify_all_valid_links(self, linker, make_links):
         """Test verifying all links when all are valid."""
-        linker.create_link("link1.txt", "file1.txt")
-        linker.create_link("link2.txt", "file2.txt")
+        make_links(("link1.txt", "file1.txt"), ("link2.txt", "file2.txt"))
         
         result = linker.verify_all_links()
         
@@ -382,10 +433,9 @@ class TestVerifyAllLinks:
         assert result['broken'] == 0
         assert len(result['broken_links']) == 0
     
-    def test_verify_all_with_broken_link(self, linker):
+    def test_verify_all_with_broken_link(self, linker, make_links):
         """Test verifying all links with broken link."""
-        linker.create_link("link1.txt", "file1.txt")
-        linker.create_link("link2.txt", "file2.txt")
+        make_links(("link1.txt", "file1.txt"), ("link2.txt", "file2.txt"))
         
         # Break one link
         (linker.project_root / "file2.txt").unlink()
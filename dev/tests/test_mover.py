@@ -2,9 +2,9 @@
 Unit tests for the FileMover module.
 """
 
-import tempfile
-import shutil
-from pathlib import Path
+import errno
+import hashlib
+import os
 import pytest
 
 from reorg_tool.mover import FileMover
@@ -12,46 +12,54 @@ from reorg_tool.transaction_log import TransactionLog
 from reorg_tool.exceptions import FileOperationError
 
 
+# Sample project files whose content is read back: (relpath, content)
+CONTENT_FILES = (
+    ("file1.txt", b"content1"),
+)
+
+# Sample project files that only need to exist (created empty)
+TOUCH_FILES = (
+    "file2.py",
+    "subdir/file3.txt",
+)
+
+
+@pytest.fixture(scope="module")
+def _template_project(build_template):
+    """Build the sample project tree once per module (read-only)."""
+    return build_template("mover_template", CONTENT_FILES, TOUCH_FILES)
+
+
 class TestFileMover:
     """Test cases for FileMover class."""
     
     @pytest.fixture
-    def temp_project(self):
-        """Create a temporary project for testing."""
-        temp_dir = tempfile.mkdtemp()
-        project_root = Path(temp_dir) / "test_project"
-        project_root.mkdir()
-        
-        # Create test files
-        (project_root / "file1.txt").write_text("content1")
-        (project_root / "file2.py").write_text("print('hello')")
-        
-        # Create subdirectory with file
-        subdir = project_root / "subdir"
-        subdir.mkdir()
-        (subdir / "file3.txt").write_text("content3")
-        
-        yield str(project_root)
-        
-        # Cleanup
-        shutil.rmtree(temp_dir)
+    def temp_project(self, tmp_path, _template_project, link_tree):
+        """
+        Create a temporary project for testing.
+        
+        Files are hardlinked from the template. Moves rename them (keeping
+        the shared inode) and tests never write into moved files in place,
+        so the template is never modified.
+        """
+        return link_tree(_template_project, tmp_path / "test_project")
     
     @pytest.fixture
     def mover(self, temp_project):
         """Create a FileMover instance."""
-        return FileMover(temp_project)
+        return FileMover(str(temp_project))
     
     @pytest.fixture
-    def mover_with_log(self, temp_project):
-        """Create a FileMover with transaction log."""
-        log_path = Path(temp_project) / "transaction.log"
-        transaction_log = TransactionLog(str(log_path))
-        return FileMover(temp_project, transaction_log)
+    def mover_with_log(self, temp_project, tmp_path):
+        """Create a FileMover with an in-memory transaction log."""
+        log_path = tmp_path / "transaction.log"
+        transaction_log = TransactionLog(str(log_path), autosave=False)
+        return FileMover(str(temp_project), transaction_log)
     
     def test_mover_initialization(self, mover, temp_project):
         """Test FileMover initialization."""
         assert mover is not None
-        assert mover.project_root == Path(temp_project).resolve()
+        assert mover.project_root == temp_project.resolve()
     
     def test_mover_invalid_root(self):
         """Test FileMover with invalid project root."""
@@ -63,19 +71,50 @@ class TestFileMover:
         result = mover.move_file("file1.txt", "moved/file1.txt")
         
         # Check result
-        assert result['success'] is True
-        assert result['source'] == "file1.txt"
-        assert result['destination'] == "moved/file1.txt"
-        assert 'checksum' in result
+        assert result == {
+            'success': True,
+            'source': "file1.txt",
+            'destination': "moved/file1.txt",
+            'checksum': hashlib.md5(b"content1").hexdigest(),
+        }
         
         # Verify file was moved
-        assert not (Path(temp_project) / "file1.txt").exists()
-        assert (Path(temp_project) / "moved/file1.txt").exists()
+        moved_file = temp_project / "moved" / "file1.txt"
+        assert not (temp_project / "file1.txt").exists()
+        assert moved_file.exists()
         
         # Verify content
-        content = (Path(temp_project) / "moved/file1.txt").read_text()
+        content = moved_file.read_text()
         assert content == "content1"
     
+    def test_move_file_across_devices(self, mover, temp_project, monkeypatch):
+        """Test that a cross-device move falls back to copy + verify + delete."""
+        def exdev_rename(src, dst):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV), str(src), None, str(dst))
+        
+        monkeypatch.setattr("reorg_tool.mover.os.rename", exdev_rename)
+        
+        result = mover.move_file("file1.txt", "moved/file1.txt")
+        
+        assert result['success'] is True
+        assert result['checksum'] == hashlib.md5(b"content1").hexdigest()
+        assert not (temp_project / "file1.txt").exists()
+        assert (temp_project / "moved" / "file1.txt").read_bytes() == b"content1"
+    
+    def test_move_relative_symlink(self, mover, temp_project):
+        """Test that moving a relative symlink keeps its content reachable."""
+        os.symlink("file1.txt", temp_project / "alias.txt")
+        
+        result = mover.move_file("alias.txt", "moved/alias.txt")
+        
+        moved = temp_project / "moved" / "alias.txt"
+        assert result['success'] is True
+        assert os.path.exists(moved)
+        assert not moved.is_symlink()
+        assert moved.read_bytes() == b"content1"
+        assert not os.path.lexists(temp_project / "alias.txt")
+        assert (temp_project / "file1.txt").exists()
+    
     def test_move_file_nonexistent_source(self, mover):
         """Test moving a nonexistent file."""
         with pytest.raises(FileOperationError):
@@ -84,7 +123,7 @@ class TestFileMover:
     def test_move_file_existing_destination(self, mover, temp_project):
         """Test moving to an existing destination."""
         # Create destination file
-        dest_dir = Path(temp_project) / "moved"
+        dest_dir = temp_project / "moved"
         dest_dir.mkdir()
         (dest_dir / "file1.txt").write_text("existing")
         
@@ -92,12 +131,12 @@ class TestFileMover:
         with pytest.raises(FileOperationError):
             mover.move_file("file1.txt", "moved/file1.txt")
     
-    def test_move_file_with_transaction_log(self, temp_project):
+    def test_move_file_with_transaction_log(self, temp_project, tmp_path):
         """Test that FileMover accepts and stores a transaction log."""
-        # Create mover with transaction log
-        log_path = str(Path(temp_project) / "test.log")
+        # Create mover with transaction log (kept outside the project tree)
+        log_path = str(tmp_path / "test.log")
         transaction_log = TransactionLog(log_path)
-        mover = FileMover(temp_project, transaction_log)
+        mover = FileMover(str(temp_project), transaction_log)
         
         # Verify log is attached
         assert mover.transaction_log is transaction_log
@@ -108,8 +147,8 @@ class TestFileMover:
         assert result['success'] is True
         
         # Verify file was moved
-        assert not (Path(temp_project) / "file1.txt").exists()
-        assert (Path(temp_project) / "moved/file1.txt").exists()
+        assert not (temp_project / "file1.txt").exists()
+        assert (temp_project / "moved" / "file1.txt").exists()
         
         # Note: The actual transaction logging integration is tested
         # in integration tests. This unit test just verifies that
@@ -131,9 +170,10 @@ class TestFileMover:
         assert len(result['errors']) == 0
         
         # Verify all files were moved
-        assert (Path(temp_project) / "moved/file1.txt").exists()
-        assert (Path(temp_project) / "moved/file2.py").exists()
-        assert (Path(temp_project) / "moved/file3.txt").exists()
+        moved = temp_project / "moved"
+        assert (moved / "file1.txt").exists()
+        assert (moved / "file2.py").exists()
+        assert (moved / "file3.txt").exists()
     
     def test_move_batch_with_errors(self, mover):
         """Test batch move with some failures."""
@@ -155,7 +195,7 @@ class TestFileMover:
         # Move file
         mover.move_file("file1.txt", "moved/file1.txt")
         
-        # Preserve permissions (in this case, they're already preserved by copy2)
+        # Preserve permissions (in this case, a same-filesystem rename keeps the inode's)
         # This test mainly checks the method doesn't error
         mover.preserve_permissions("file2.py", "file2.py")
     
@@ -174,16 +214,18 @@ class TestFileMover:
         mover.move_file("file1.txt", "moved/file1.txt")
         
         # Verify moved
-        assert not (Path(temp_project) / "file1.txt").exists()
-        assert (Path(temp_project) / "moved/file1.txt").exists()
+        original = temp_project / "file1.txt"
+        moved_file = temp_project / "moved" / "file1.txt"
+        assert not original.exists()
+        assert moved_file.exists()
         
         # Rollback
         success = mover.rollback_move("file1.txt", "moved/file1.txt")
         assert success is True
         
         # Verify rolled back
-        assert (Path(temp_project) / "file1.txt").exists()
-        assert not (Path(temp_project) / "moved/file1.txt").exists()
+        assert original.exists()
+        assert not moved_file.exists()
     
     def test_checksum_verification(self, mover, temp_project):
         """Test that checksum verification works."""
@@ -191,12 +233,17 @@ class TestFileMover:
         result = mover.move_file("file1.txt", "moved/file1.txt")
         
         # Calculate checksum of moved file
-        moved_path = Path(temp_project) / "moved/file1.txt"
+        moved_path = temp_project / "moved/file1.txt"
         checksum = mover._calculate_checksum(moved_path)
         
         # Should match the checksum in result
         assert checksum == result['checksum']
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    
+    @pytest.mark.parametrize("file_digest", [True, False], ids=["file_digest", "readinto"])
+    def test_calculate_checksum_is_md5(self, mover, temp_project, monkeypatch, file_digest):
+        """Test that both checksum code paths produce the file's MD5."""
+        monkeypatch.setattr("reorg_tool.backup._HAS_FILE_DIGEST",
+                            file_digest and hasattr(hashlib, "file_digest"))
+        
+        for rel, data in (*CONTENT_FILES, *((rel, b"") for rel in TOUCH_FILES)):
+            assert mover._calculate_checksum(temp_project / rel) == hashlib.md5(data).hexdigest()
@@ -2,52 +2,76 @@
 Unit tests for the reporter module.
 """
 
+import os
 import pytest
 from pathlib import Path
-import tempfile
 import shutil
 from datetime import datetime
 
 from reorg_tool.reporter import ReorganizationReporter
 from reorg_tool.models import ReorgResult, ReorgPhase
-from reorg_tool.linker import SymbolicLinker
 
 
-@pytest.fixture
-def temp_project():
-    """Create a temporary project directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    
+# Sample project files (relative path, content)
+TEMPLATE_FILES = (
+    ("file1.txt", "content1"),
+    ("file2.txt", "content2"),
+    ("dir1/file3.txt", "content3"),
+    ("dir2/subdir/file4.txt", "content4"),
+)
+
+
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory):
+    """Build the sample project tree once per session (read-only)."""
     # Create test directory structure
-    project_root = Path(temp_dir) / "test_project"
-    project_root.mkdir()
-    
-    # Create some test files and directories
-    (project_root / "file1.txt").write_text("content1")
-    (project_root / "file2.txt").write_text("content2")
-    
-    (project_root / "dir1").mkdir()
-    (project_root / "dir1" / "file3.txt").write_text("content3")
-    
-    (project_root / "dir2").mkdir()
-    (project_root / "dir2" / "subdir").mkdir()
-    (project_root / "dir2" / "subdir" / "file4.txt").write_text("content4")
+    project_root = tmp_path_factory.mktemp("reporter_template") / "test_project"
+    base = str(project_root)
     
-    yield project_root
+    # Create each directory once, then write the files
+    for parent in {os.path.dirname(rel) for rel, _ in TEMPLATE_FILES}:
+        os.makedirs(os.path.join(base, parent), exist_ok=True)
+    for rel, content in TEMPLATE_FILES:
+        with open(os.path.join(base, rel), "w") as f:
+            f.write(content)
     
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return project_root
 
 
 @pytest.fixture
-def reporter(temp_project):
-    """Create a ReorganizationReporter instance for testing."""
-    return ReorganizationReporter(str(temp_project))
+def temp_project(tmp_path, project_template):
+    """Create a temporary project directory for testing (a copy of the template)."""
+    project_root = tmp_path / "test_project"
+    shutil.copytree(project_template, project_root)
+    return project_root
+
+
+@pytest.fixture(scope="session")
+def temp_project_with_link(tmp_path_factory, project_template):
+    """Copy of the template with one symbolic link, built once per session (read-only)."""
+    from reorg_tool.linker import SymbolicLinker
+    
+    project_root = tmp_path_factory.mktemp("reporter_linkproj") / "test_project"
+    shutil.copytree(project_template, project_root)
+    SymbolicLinker(str(project_root)).create_link("link_to_file1.txt", "file1.txt")
+    return project_root
+
+
+@pytest.fixture(scope="module")
+def reporter(project_template):
+    """Create a ReorganizationReporter over the shared, read-only project."""
+    return ReorganizationReporter(str(project_template))
 
 
 @pytest.fixture
+def project_reporter(temp_project):
+    """Create a ReorganizationReporter over a per-test copy, for tests that write into it."""
+    return ReorganizationReporter(str(temp_project))
+
+
+@pytest.fixture(scope="session")
 def sample_result():
-    """Create a sample ReorgResult for testing."""
+    """Create a sample ReorgResult for testing (shared; tests must not modify it)."""
     start_time = datetime(2025, 1, 1, 10, 0, 0)
     end_time = datetime(2025, 1, 1, 10, 5, 30)
     
@@ -60,21 +84,61 @@ def sample_result():
         links_created=15,
         files_deleted=5,
         backup_path="/backup/project_backup_20250101",
-        transaction_log_path="/logs/transaction.log"
+        transaction_log_path="/logs/transaction.log",
+        warnings=["Test warning"],
     )
     
-    result.add_warning("Test warning")
-    
     return result
 
 
+@pytest.fixture(scope="module")
+def default_markdown(reporter, sample_result, tmp_path_factory):
+    """Write the Markdown report once with default options; returns (output_path, content)."""
+    output_path = reporter.create_markdown_report(
+        sample_result,
+        output_path=str(tmp_path_factory.mktemp("md") / "REORGANIZATION_SUMMARY.md")
+    )
+    return output_path, Path(output_path).read_text()
+
+
+@pytest.fixture(scope="module")
+def summary_text(reporter, sample_result):
+    """Summary report for sample_result, generated once per module."""
+    return reporter.generate_summary_report(sample_result)
+
+
+@pytest.fixture(scope="module")
+def detailed_text(reporter, sample_result):
+    """Detailed report for sample_result, generated once per module."""
+    return reporter.generate_detailed_report(sample_result)
+
+
+@pytest.fixture(scope="module")
+def statistics(reporter, sample_result):
+    """Statistics summary for sample_result, generated once per module."""
+    return reporter.generate_statistics_summary(sample_result)
+
+
+@pytest.fixture(scope="module")
+def tree_cache(reporter):
+    """Memoized reporter.generate_directory_tree, keyed by its keyword arguments."""
+    cache = {}
+    
+    def get(**kwargs):
+        key = tuple(sorted(kwargs.items()))
+        if key not in cache:
+            cache[key] = reporter.generate_directory_tree(**kwargs)
+        return cache[key]
+    
+    return get
+
+
 class TestReporterInit:
     """Test ReorganizationReporter initialization."""
     
-    def test_init_with_valid_path(self, temp_project):
+    def test_init_with_valid_path(self, reporter, project_template):
         """Test initialization with valid project root."""
-        reporter = ReorganizationReporter(str(temp_project))
-        assert reporter.project_root == temp_project
+        assert reporter.project_root == project_template
     
     def test_init_with_invalid_path(self):
         """Test initialization with invalid project root."""
@@ -85,15 +149,17 @@ class TestReporterInit:
 class TestGenerateSummaryReport:
     """Test summary report generation."""
     
-    def test_generate_summary_success(self, reporter, sample_result):
+    def test_generate_summary_success(self, summary_text):
         """Test generating summary for successful reorganization."""
-        report = reporter.generate_summary_report(sample_result)
-        
-        assert "Reorganization Summary" in report
-        assert "✅ SUCCESS" in report
-        assert "Files Moved: 25" in report
-        assert "Symbolic Links Created: 15" in report
-        assert "Files Deleted: 5" in report
+        needles = (
+            "Reorganization Summary",
+            "✅ SUCCESS",
+            "Files Moved: 25",
+            "Symbolic Links Created: 15",
+            "Files Deleted: 5",
+        )
+        missing = [n for n in needles if n not in summary_text]
+        assert not missing, missing
     
     def test_generate_summary_with_errors(self, reporter):
         """Test generating summary with errors."""
@@ -107,45 +173,31 @@ class TestGenerateSummaryReport:
         
         report = reporter.generate_summary_report(result)
         
-        assert "❌ FAILED" in report
-        assert "## Errors" in report
-        assert "Test error 1" in report
-        assert "Test error 2" in report
-    
-    def test_generate_summary_with_warnings(self, reporter, sample_result):
-        """Test generating summary with warnings."""
-        report = reporter.generate_summary_report(sample_result)
-        
-        assert "## Warnings" in report
-        assert "Test warning" in report
-    
-    def test_generate_summary_includes_duration(self, reporter, sample_result):
-        """Test that summary includes duration."""
-        report = reporter.generate_summary_report(sample_result)
-        
-        assert "Duration" in report
-        assert "330.00 seconds" in report  # 5 minutes 30 seconds
-    
-    def test_generate_summary_includes_phases(self, reporter, sample_result):
-        """Test that summary includes completed phases."""
-        report = reporter.generate_summary_report(sample_result)
-        
-        assert "## Phases Completed" in report
-        assert "scan" in report
-        assert "classify" in report
-        assert "move_core" in report
+        needles = ("❌ FAILED", "## Errors", "Test error 1", "Test error 2")
+        missing = [n for n in needles if n not in report]
+        assert not missing, missing
+    
+    @pytest.mark.parametrize("needle", [
+        # Warnings
+        "## Warnings", "Test warning",
+        # Duration (5 minutes 30 seconds)
+        "Duration", "330.00 seconds",
+        # Completed phases
+        "## Phases Completed", "scan", "classify", "move_core",
+    ])
+    def test_summary_contains(self, summary_text, needle):
+        """Test that the summary includes warnings, duration and phases."""
+        assert needle in summary_text
 
 
 class TestGenerateDetailedReport:
     """Test detailed report generation."""
     
-    def test_generate_detailed_basic(self, reporter, sample_result):
+    def test_generate_detailed_basic(self, detailed_text):
         """Test generating basic detailed report."""
-        report = reporter.generate_detailed_report(sample_result)
-        
-        assert "# Detailed Reorganization Report" in report
-        assert "## Summary" in report
-        assert "Generated:" in report
+        needles = ("# Detailed Reorganization Report", "## Summary", "Generated:")
+        missing = [n for n in needles if n not in detailed_text]
+        assert not missing, missing
     
     def test_generate_detailed_with_file_mappings(self, reporter, sample_result):
         """Test detailed report with file mappings."""
@@ -212,78 +264,71 @@ class TestGenerateDetailedReport:
         assert "❌ 1 missing files" in report
         assert "missing.txt" in report
     
-    def test_generate_detailed_includes_backup_info(self, reporter, sample_result):
+    def test_generate_detailed_includes_backup_info(self, detailed_text, sample_result):
         """Test that detailed report includes backup information."""
-        report = reporter.generate_detailed_report(sample_result)
-        
-        assert "## Backup" in report
-        assert sample_result.backup_path in report
+        assert "## Backup" in detailed_text
+        assert sample_result.backup_path in detailed_text
     
-    def test_generate_detailed_includes_transaction_log(self, reporter, sample_result):
+    def test_generate_detailed_includes_transaction_log(self, detailed_text, sample_result):
         """Test that detailed report includes transaction log path."""
-        report = reporter.generate_detailed_report(sample_result)
-        
-        assert "## Transaction Log" in report
-        assert sample_result.transaction_log_path in report
+        assert "## Transaction Log" in detailed_text
+        assert sample_result.transaction_log_path in detailed_text
 
 
 class TestGenerateDirectoryTree:
     """Test directory tree generation."""
     
-    def test_generate_tree_basic(self, reporter):
+    def test_generate_tree_basic(self, tree_cache):
         """Test generating basic directory tree."""
-        tree = reporter.generate_directory_tree(max_depth=2)
+        tree = tree_cache(max_depth=2)
         
         assert "test_project/" in tree
         assert "dir1/" in tree
         assert "dir2/" in tree
     
-    def test_generate_tree_with_files(self, reporter):
+    def test_generate_tree_with_files(self, tree_cache):
         """Test generating tree with files."""
-        tree = reporter.generate_directory_tree(show_files=True)
+        tree = tree_cache(show_files=True)
         
         assert "file1.txt" in tree
         assert "file2.txt" in tree
     
-    def test_generate_tree_without_files(self, reporter):
+    def test_generate_tree_without_files(self, tree_cache):
         """Test generating tree without files."""
-        tree = reporter.generate_directory_tree(show_files=False)
+        tree = tree_cache(show_files=False)
         
         assert "dir1/" in tree
         assert "dir2/" in tree
         assert "file1.txt" not in tree
         assert "file2.txt" not in tree
     
-    def test_generate_tree_with_depth_limit(self, reporter):
+    def test_generate_tree_with_depth_limit(self, tree_cache):
         """Test generating tree with depth limit."""
-        tree = reporter.generate_directory_tree(max_depth=1, show_files=False)
+        tree = tree_cache(max_depth=1, show_files=False)
         
         assert "dir1/" in tree
         assert "dir2/" in tree
         # subdir should not appear due to depth limit
         assert "subdir/" not in tree
     
-    def test_generate_tree_with_symbolic_links(self, reporter, temp_project):
+    def test_generate_tree_with_symbolic_links(self, temp_project_with_link):
         """Test generating tree with symbolic links."""
-        # Create a symbolic link
-        linker = SymbolicLinker(str(temp_project))
-        linker.create_link("link_to_file1.txt", "file1.txt")
-        
+        reporter = ReorganizationReporter(str(temp_project_with_link))
         tree = reporter.generate_directory_tree(show_files=True)
         
         assert "link_to_file1.txt" in tree
         assert "->" in tree  # Arrow indicating symbolic link
     
-    def test_generate_tree_subdirectory(self, reporter):
+    def test_generate_tree_subdirectory(self, tree_cache):
         """Test generating tree for specific subdirectory."""
-        tree = reporter.generate_directory_tree(directory="dir1", show_files=True)
+        tree = tree_cache(directory="dir1", show_files=True)
         
         assert "dir1/" in tree
         assert "file3.txt" in tree
     
-    def test_generate_tree_nonexistent_directory(self, reporter):
+    def test_generate_tree_nonexistent_directory(self, tree_cache):
         """Test generating tree for nonexistent directory."""
-        tree = reporter.generate_directory_tree(directory="nonexistent")
+        tree = tree_cache(directory="nonexistent")
         
         assert "does not exist" in tree
 
@@ -291,44 +336,45 @@ class TestGenerateDirectoryTree:
 class TestCreateMarkdownReport:
     """Test Markdown report creation."""
     
-    def test_create_markdown_basic(self, reporter, sample_result, temp_project):
-        """Test creating basic Markdown report."""
-        output_path = reporter.create_markdown_report(sample_result)
+    def test_create_markdown_default_path(self, project_reporter, sample_result, temp_project):
+        """Test that the report is written to the project root by default."""
+        output_path = project_reporter.create_markdown_report(sample_result)
         
-        assert Path(output_path).exists()
+        assert Path(output_path).is_file()
         assert output_path.endswith("REORGANIZATION_SUMMARY.md")
-        
-        # Read and verify content
-        content = Path(output_path).read_text()
+    
+    def test_create_markdown_basic(self, default_markdown):
+        """Test creating basic Markdown report."""
+        _, content = default_markdown
         assert "# Project Reorganization Report" in content
         assert "## Executive Summary" in content
     
-    def test_create_markdown_custom_path(self, reporter, sample_result, temp_project):
+    def test_create_markdown_custom_path(self, project_reporter, sample_result, temp_project):
         """Test creating Markdown report with custom path."""
         custom_path = temp_project / "custom_report.md"
-        output_path = reporter.create_markdown_report(sample_result, output_path=str(custom_path))
+        output_path = project_reporter.create_markdown_report(sample_result, output_path=str(custom_path))
         
-        assert Path(output_path).exists()
+        assert Path(output_path).is_file()
         assert output_path == str(custom_path)
     
-    def test_create_markdown_with_file_mappings(self, reporter, sample_result, temp_project):
+    def test_create_markdown_with_file_mappings(self, project_reporter, sample_result, temp_project):
         """Test creating report with file mappings."""
         file_mappings = [
             {'old_path': 'old/file1.py', 'new_path': 'new/file1.py', 'category': 'core'},
             {'old_path': 'old/file2.py', 'new_path': 'new/file2.py', 'category': 'docs'},
         ]
         
-        output_path = reporter.create_markdown_report(
+        output_path = project_reporter.create_markdown_report(
             sample_result,
             file_mappings=file_mappings
         )
         
-        content = Path(output_path).read_text()
-        assert "## File Relocations" in content
-        assert "old/file1.py" in content
-        assert "new/file1.py" in content
+        content = Path(output_path).read_bytes()
+        assert b"## File Relocations" in content
+        assert b"old/file1.py" in content
+        assert b"new/file1.py" in content
     
-    def test_create_markdown_with_validation(self, reporter, sample_result, temp_project):
+    def test_create_markdown_with_validation(self, project_reporter, sample_result, temp_project):
         """Test creating report with validation summary."""
         validation_summary = {
             'all_passed': True,
@@ -337,56 +383,45 @@ class TestCreateMarkdownReport:
             'files': {'all_present': True, 'missing_count': 0, 'missing_files': []},
         }
         
-        output_path = reporter.create_markdown_report(
+        output_path = project_reporter.create_markdown_report(
             sample_result,
             validation_summary=validation_summary
         )
         
-        content = Path(output_path).read_text()
-        assert "## Validation Results" in content
-        assert "✅ PASSED" in content
+        content = Path(output_path).read_bytes()
+        assert b"## Validation Results" in content
+        assert "✅ PASSED".encode() in content
     
-    def test_create_markdown_without_tree(self, reporter, sample_result, temp_project):
+    def test_create_markdown_without_tree(self, project_reporter, sample_result, temp_project):
         """Test creating report without directory tree."""
-        output_path = reporter.create_markdown_report(
+        output_path = project_reporter.create_markdown_report(
             sample_result,
             include_tree=False
         )
         
-        content = Path(output_path).read_text()
-        assert "## New Directory Structure" not in content
+        content = Path(output_path).read_bytes()
+        assert b"## New Directory Structure" not in content
     
-    def test_create_markdown_with_tree(self, reporter, sample_result, temp_project):
-        """Test creating report with directory tree."""
-        output_path = reporter.create_markdown_report(
-            sample_result,
-            include_tree=True
-        )
-        
-        content = Path(output_path).read_text()
+    def test_create_markdown_with_tree(self, default_markdown):
+        """Test creating report with directory tree (the default)."""
+        _, content = default_markdown
         assert "## New Directory Structure" in content
     
-    def test_create_markdown_includes_statistics_table(self, reporter, sample_result, temp_project):
+    def test_create_markdown_includes_statistics_table(self, default_markdown):
         """Test that report includes statistics table."""
-        output_path = reporter.create_markdown_report(sample_result)
-        
-        content = Path(output_path).read_text()
-        assert "## Detailed Statistics" in content
-        assert "| Metric | Value |" in content
-        assert "| Files Moved | 25 |" in content
+        _, content = default_markdown
+        needles = ("## Detailed Statistics", "| Metric | Value |", "| Files Moved | 25 |")
+        missing = [n for n in needles if n not in content]
+        assert not missing, missing
     
-    def test_create_markdown_includes_next_steps(self, reporter, sample_result, temp_project):
+    def test_create_markdown_includes_next_steps(self, default_markdown):
         """Test that report includes next steps."""
-        output_path = reporter.create_markdown_report(sample_result)
-        
-        content = Path(output_path).read_text()
+        _, content = default_markdown
         assert "## Next Steps" in content
     
-    def test_create_markdown_includes_rollback_info(self, reporter, sample_result, temp_project):
+    def test_create_markdown_includes_rollback_info(self, default_markdown):
         """Test that report includes rollback information."""
-        output_path = reporter.create_markdown_report(sample_result)
-        
-        content = Path(output_path).read_text()
+        _, content = default_markdown
         assert "## Backup and Rollback" in content
         assert "To rollback the reorganization:" in content
 
@@ -394,43 +429,31 @@ class TestCreateMarkdownReport:
 class TestGenerateStatisticsSummary:
     """Test statistics summary generation."""
     
-    def test_generate_statistics_basic(self, reporter, sample_result):
+    def test_generate_statistics_basic(self, statistics):
         """Test generating basic statistics summary."""
-        summary = reporter.generate_statistics_summary(sample_result)
-        
-        assert summary['success'] is True
-        assert summary['files_moved'] == 25
-        assert summary['links_created'] == 15
-        assert summary['files_deleted'] == 5
-    
-    def test_generate_statistics_includes_times(self, reporter, sample_result):
-        """Test that statistics include timestamps."""
-        summary = reporter.generate_statistics_summary(sample_result)
-        
-        assert 'start_time' in summary
-        assert 'end_time' in summary
-        assert 'duration_seconds' in summary
-    
-    def test_generate_statistics_includes_phases(self, reporter, sample_result):
+        assert statistics['success'] is True
+        assert statistics['files_moved'] == 25
+        assert statistics['links_created'] == 15
+        assert statistics['files_deleted'] == 5
+    
+    @pytest.mark.parametrize("key", [
+        # Timestamps
+        'start_time', 'end_time', 'duration_seconds',
+        # Phases, error and warning counts
+        'phases_completed', 'error_count', 'warning_count',
+        # Backup and log paths
+        'backup_path', 'transaction_log_path',
+    ])
+    def test_generate_statistics_includes_key(self, statistics, key):
+        """Test that statistics include timestamps, counts and paths."""
+        assert key in statistics
+    
+    def test_generate_statistics_includes_phases(self, statistics):
         """Test that statistics include completed phases."""
-        summary = reporter.generate_statistics_summary(sample_result)
-        
-        assert 'phases_completed' in summary
-        assert 'scan' in summary['phases_completed']
-        assert 'classify' in summary['phases_completed']
+        assert 'scan' in statistics['phases_completed']
+        assert 'classify' in statistics['phases_completed']
     
-    def test_generate_statistics_includes_counts(self, reporter, sample_result):
-        """Test that statistics include error and warning counts."""
-        summary = reporter.generate_statistics_summary(sample_result)
-        
-        assert 'error_count' in summary
-        assert 'warning_count' in summary
-        assert summary['warning_count'] == 1
-    
-    def test_generate_statistics_includes_paths(self, reporter, sample_result):
-        """Test that statistics include backup and log paths."""
-        summary = reporter.generate_statistics_summary(sample_result)
-        
-        assert 'backup_path' in summary
-        assert 'transaction_log_path' in summary
-        assert summary['backup_path'] == sample_result.backup_path
+    def test_generate_statistics_values(self, statistics, sample_result):
+        """Test warning count and backup path values."""
+        assert statistics['warning_count'] == 1
+        assert statistics['backup_path'] == sample_result.backup_path
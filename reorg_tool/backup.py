@@ -5,6 +5,7 @@ Creates and manages project backups.
 """
 
 import os
+import json
 import shutil
 import hashlib
 from pathlib import Path
@@ -13,6 +14,51 @@ from typing import List, Optional
 
 from .exceptions import FileOperationError
 
+try:
+    import blake3  # Optional: SIMD-accelerated hashing for algo='blake3'
+except ImportError:
+    blake3 = None
+
+
+# hashlib.file_digest (Python 3.11+) hashes straight from the file descriptor in C
+_HAS_FILE_DIGEST = hasattr(hashlib, 'file_digest')
+
+# Per-file MD5 manifest written into each backup while copying
+CHECKSUM_MANIFEST = '.backup_checksums.json'
+
+
+def _file_checksum(file_path, algo: str = 'md5', buf_size: int = 1 << 20, sink=None) -> str:
+    """
+    Hash a file's contents, optionally copying them to an open file as they are read.
+    
+    Shared by BackupService and FileMover so both compute checksums the same way.
+    
+    Args:
+        file_path: Path to file
+        algo: 'blake3' (requires the optional blake3 package) or any hashlib
+            algorithm name
+        buf_size: Read buffer size in bytes for the readinto loop, used when
+            copying or when hashlib.file_digest is unavailable (Python < 3.11)
+        sink: Binary file object that receives every chunk read (optional)
+    
+    Returns:
+        Hex checksum string
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        if sink is None and algo != 'blake3' and _HAS_FILE_DIGEST:
+            return hashlib.file_digest(f, algo).hexdigest()
+        
+        # Unbuffered reads into one reusable buffer keep syscalls and copies down
+        hasher = blake3.blake3() if algo == 'blake3' else hashlib.new(algo)
+        buf = bytearray(buf_size)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            chunk = view[:n]
+            if sink is not None:
+                sink.write(chunk)
+            hasher.update(chunk)
+        return hasher.hexdigest()
+
 
 class BackupService:
     """Creates and manages project backups."""
@@ -26,6 +72,8 @@ class BackupService:
             backup_dir: Directory to store backups (defaults to parent of project_root)
         """
         self.project_root = Path(project_root).resolve()
+        # String form for os.path hot paths (avoids PurePath overhead per file)
+        self.project_root_str = str(self.project_root)
         
         if not self.project_root.exists():
             raise FileOperationError(f"Project root does not exist: {project_root}")
@@ -60,6 +108,16 @@ class BackupService:
         if backup_path.exists():
             raise FileOperationError(f"Backup already exists: {backup_path}")
         
+        checksums = {}
+        
+        def copy_and_hash(src, dst):
+            # Hash each file from the same buffer that writes it, so the
+            # source never has to be read a second time for checksums
+            rel_path = os.path.relpath(src, self.project_root_str).replace(os.sep, '/')
+            checksums[rel_path] = self._copy_with_checksum(src, dst)
+            shutil.copystat(src, dst)
+            return dst
+        
         try:
             # Copy entire project directory
             print(f"Creating backup: {backup_path}")
@@ -67,9 +125,13 @@ class BackupService:
                 self.project_root,
                 backup_path,
                 symlinks=False,  # Don't follow symlinks
-                ignore=self._get_ignore_patterns()
+                ignore=self._get_ignore_patterns(),
+                copy_function=copy_and_hash
             )
             
+            with open(backup_path / CHECKSUM_MANIFEST, 'w', encoding='utf-8') as f:
+                json.dump(checksums, f, indent=2, sort_keys=True)
+            
             print(f"Backup created successfully: {backup_path}")
             return str(backup_path)
         
@@ -79,6 +141,21 @@ class BackupService:
                 shutil.rmtree(backup_path)
             raise FileOperationError(f"Failed to create backup: {e}")
     
+    def _copy_with_checksum(self, src: str, dst: str, buf_size: int = 1 << 20) -> str:
+        """
+        Copy a file and compute its MD5 checksum in a single pass.
+        
+        Args:
+            src: Source file path
+            dst: Destination file path
+            buf_size: Read buffer size in bytes (defaults to 1 MiB)
+        
+        Returns:
+            MD5 checksum string of the copied data
+        """
+        with open(dst, 'wb') as fdst:
+            return _file_checksum(src, buf_size=buf_size, sink=fdst)
+    
     def _get_ignore_patterns(self):
         """
         Get patterns to ignore during backup.
@@ -104,12 +181,14 @@ class BackupService:
         
         return shutil.ignore_patterns(*ignore_patterns)
     
-    def verify_backup(self, backup_path: str) -> bool:
+    def verify_backup(self, backup_path: str, check_checksums: bool = True) -> bool:
         """
         Verify backup integrity by comparing file counts and key files.
         
         Args:
             backup_path: Path to backup directory
+            check_checksums: Re-hash backup files against the checksum
+                manifest recorded during create_backup (if present)
         
         Returns:
             True if backup is valid
@@ -123,7 +202,8 @@ class BackupService:
         try:
             # Count files in original and backup
             original_files = self._count_files(self.project_root)
-            backup_files = self._count_files(backup_path)
+            manifest_path = backup_path / CHECKSUM_MANIFEST
+            backup_files = self._count_files(backup_path) - manifest_path.exists()
             
             # Allow some difference due to ignored patterns
             file_diff = abs(original_files - backup_files)
@@ -152,6 +232,20 @@ class BackupService:
                     print(f"File size mismatch: {rel_path}")
                     return False
             
+            # Compare backup contents against checksums taken while copying
+            if check_checksums and manifest_path.exists():
+                with open(manifest_path, encoding='utf-8') as f:
+                    checksums = json.load(f)
+                
+                for rel_path, expected in checksums.items():
+                    backup_file = backup_path / rel_path
+                    if not backup_file.exists():
+                        print(f"File missing in backup: {rel_path}")
+                        return False
+                    if self.calculate_checksum(str(backup_file)) != expected:
+                        print(f"Checksum mismatch: {rel_path}")
+                        return False
+            
             print(f"Backup verification successful: {backup_path}")
             return True
         
@@ -195,23 +289,29 @@ class BackupService:
             'README.md',
         ]
     
-    def calculate_checksum(self, file_path: str) -> str:
+    def calculate_checksum(self, file_path: str, buf_size: int = 1 << 20,
+                           algo: str = 'md5') -> str:
         """
-        Calculate MD5 checksum of a file.
+        Calculate the checksum of a file.
         
         Args:
             file_path: Path to file
+            buf_size: Read buffer size in bytes for the fallback loop
+                used when hashlib.file_digest is unavailable (Python < 3.11)
+            algo: Hash algorithm; 'md5' (default, matches backup manifests),
+                'blake3' (requires the optional blake3 package) or any
+                hashlib algorithm name
         
         Returns:
-            MD5 checksum string
+            Hex checksum string
         """
-        md5 = hashlib.md5()
+        if algo == 'blake3' and blake3 is None:
+            raise FileOperationError(
+                "Failed to calculate checksum: blake3 is not installed (pip install blake3)"
+            )
         
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    md5.update(chunk)
-            return md5.hexdigest()
+            return _file_checksum(file_path, algo, buf_size)
         except Exception as e:
             raise FileOperationError(f"Failed to calculate checksum: {e}")
     
@@ -340,8 +440,13 @@ class BackupService:
             if target_path.exists():
                 shutil.rmtree(target_path)
             
-            # Copy backup to target
-            shutil.copytree(backup_path, target_path, symlinks=False)
+            # Copy backup to target (the checksum manifest is backup metadata)
+            shutil.copytree(
+                backup_path,
+                target_path,
+                symlinks=False,
+                ignore=shutil.ignore_patterns(CHECKSUM_MANIFEST)
+            )
             
             print(f"Backup restored successfully to {target_path}")
         
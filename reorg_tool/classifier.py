@@ -20,6 +20,33 @@ class FileClassifier:
     def __init__(self):
         """Initialize the file classifier with default rules."""
         self.classification_rules = self._build_classification_rules()
+        self._compiled_patterns = self._compile_patterns(self.classification_rules)
+    
+    @staticmethod
+    def _compile_patterns(rules: Dict[FileCategory, List[dict]]) -> Dict[str, re.Pattern]:
+        """
+        Precompile every regex used by the rules.
+        
+        Args:
+            rules: Classification rules
+        
+        Returns:
+            Dictionary mapping pattern strings to compiled patterns
+        """
+        compiled = {}
+        for category_rules in rules.values():
+            for rule in category_rules:
+                for key in ('name_pattern', 'path_pattern'):
+                    if key in rule and rule[key] not in compiled:
+                        compiled[rule[key]] = re.compile(rule[key])
+        return compiled
+    
+    def _pattern(self, pattern: str) -> re.Pattern:
+        """Get the compiled form of a pattern, compiling rules added after init."""
+        compiled = self._compiled_patterns.get(pattern)
+        if compiled is None:
+            compiled = self._compiled_patterns[pattern] = re.compile(pattern)
+        return compiled
     
     def _build_classification_rules(self) -> Dict[FileCategory, List[dict]]:
         """
@@ -223,12 +250,12 @@ class FileClassifier:
         
         # Name pattern match (regex)
         if 'name_pattern' in rule:
-            if re.match(rule['name_pattern'], file_info.name):
+            if self._pattern(rule['name_pattern']).match(file_info.name):
                 return True
         
         # Path pattern match (regex)
         if 'path_pattern' in rule:
-            if re.match(rule['path_pattern'], file_info.path):
+            if self._pattern(rule['path_pattern']).match(file_info.path):
                 return True
         
         # Path contains string
@@ -5,6 +5,7 @@ Provides user-friendly commands to execute reorganization operations.
 """
 
 import argparse
+import functools
 import sys
 from pathlib import Path
 from typing import Optional
@@ -18,10 +19,15 @@ from .models import ReorgConfig
 from .exceptions import ReorgError
 
 
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """
     Create the argument parser for the CLI.
     
+    The parser is built once and shared between calls; callers must not
+    add arguments to or otherwise mutate it (use ``create_parser.cache_clear()``
+    if a fresh instance is ever needed).
+    
     Returns:
         ArgumentParser instance
     """
@@ -388,18 +394,23 @@ def cmd_report(args) -> int:
         
         reporter = ReorganizationReporter(project_root)
         
-        # Generate directory tree
-        tree = reporter.generate_directory_tree(max_depth=3, show_files=False)
-        
         print("\n" + "="*60)
         print("Directory Structure")
         print("="*60)
-        print(tree)
         
+        # Stream the directory tree line by line to stdout (and the report file)
+        lines = reporter.iter_directory_tree(max_depth=3, show_files=False)
         if args.output:
             output_path = Path(args.output)
-            output_path.write_text(tree)
+            with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                for line in lines:
+                    print(line)
+                    f.write(line)
+                    f.write("\n")
             print(f"\n✅ Report saved to: {output_path}")
+        else:
+            for line in lines:
+                print(line)
         
         return 0
     
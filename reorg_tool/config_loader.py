@@ -1,19 +1,30 @@
 """
 Configuration loader for the reorganization system.
 
-Loads and validates YAML configuration files.
+Loads and validates YAML configuration files (or JSON copies of them).
 """
 
-import yaml
+import copy
+import functools
+import json
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Final, Optional, Dict, Any, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
 from .models import ReorgConfig
 from .exceptions import ReorgError
 
 
-# Default configuration template
-DEFAULT_CONFIG = """
+# Default configuration template (written verbatim; never re-emitted from a dict)
+DEFAULT_CONFIG: Final[str] = """
 # File Reorganization Configuration
 
 reorganization:
@@ -49,6 +60,30 @@ reorganization:
 """
 
 
+@functools.lru_cache(maxsize=1)
+def _default_config_dict() -> Dict[str, Any]:
+    """Parse DEFAULT_CONFIG once; callers must copy before mutating."""
+    return yaml.load(DEFAULT_CONFIG, Loader=_SafeLoader)
+
+
+# Validate the template at import (skipped under python -O, parsed lazily instead)
+if __debug__:
+    assert 'reorganization' in _default_config_dict()
+
+
+# Log levels accepted by validate_config
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+
+
+# Suffix appended to a YAML path by create_cached_json()
+_JSON_CACHE_SUFFIX = '.cache.json'
+
+
+# Parsed configuration files keyed by absolute path: (mtime_ns, size, parsed dict)
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
+
 class ConfigLoader:
     """Loads and validates reorganization configuration."""
     
@@ -58,7 +93,7 @@ class ConfigLoader:
         Load configuration from file or use defaults.
         
         Args:
-            config_path: Path to configuration file (YAML)
+            config_path: Path to configuration file (YAML or JSON)
         
         Returns:
             ReorgConfig object
@@ -93,31 +128,89 @@ class ConfigLoader:
         """
         Load YAML configuration file.
         
+        Files ending in ``.json`` are parsed as JSON. For a YAML file, the
+        ``<name>.cache.json`` copy written by create_cached_json() is read
+        instead as long as it was made from the current version of the file.
+        
         Args:
-            config_path: Path to YAML file
+            config_path: Path to YAML (or JSON) file
         
         Returns:
             Dictionary with configuration
         """
-        path = Path(config_path)
+        path = os.path.abspath(config_path)
         
-        if not path.exists():
+        try:
+            stat = os.stat(path)
+        except OSError:
             raise ReorgError(f"Configuration file not found: {config_path}")
         
+        is_json = os.path.splitext(path)[1] == '.json'
+        
+        # Reuse the parsed result while the file is unchanged (mtime + size)
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _YAML_CACHE.move_to_end(path)
+            return copy.deepcopy(cached[2])
+        
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                config_dict = yaml.safe_load(f)
+            if is_json:
+                with open(path, 'rb') as f:
+                    config_dict = json.load(f)
+            else:
+                config_dict = ConfigLoader._load_cached_json(path, stat)
+                if config_dict is None:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        config_dict = yaml.load(f, Loader=_SafeLoader)
             
             if config_dict is None:
                 config_dict = {}
             
-            return config_dict
+            _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, config_dict)
+            _YAML_CACHE.move_to_end(path)
+            if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+                _YAML_CACHE.popitem(last=False)
+            
+            return copy.deepcopy(config_dict)
         
         except yaml.YAMLError as e:
             raise ReorgError(f"Invalid YAML in configuration file: {e}")
+        except json.JSONDecodeError as e:
+            raise ReorgError(f"Invalid JSON in configuration file: {e}")
         except Exception as e:
             raise ReorgError(f"Failed to load configuration: {e}")
     
+    @staticmethod
+    def _load_cached_json(yaml_path: str, yaml_stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        Read the JSON copy of a YAML file if it matches the file's current state.
+        
+        Args:
+            yaml_path: Absolute path to the YAML file
+            yaml_stat: Current os.stat() result of the YAML file
+        
+        Returns:
+            Configuration dictionary, or None if there is no usable copy
+        """
+        try:
+            with open(yaml_path + _JSON_CACHE_SUFFIX, 'rb') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict):
+            return None
+        source = {'mtime_ns': yaml_stat.st_mtime_ns, 'size': yaml_stat.st_size}
+        if cached.get('source') != source:
+            return None
+        return cached.get('config')
+    
+    @staticmethod
+    def clear_cache():
+        """Drop all cached parsed configuration files and project root checks."""
+        _YAML_CACHE.clear()
+        ConfigLoader._validate_root.cache_clear()
+    
     @staticmethod
     def _get_default_config() -> Dict[str, Any]:
         """
@@ -126,10 +219,7 @@ class ConfigLoader:
         Returns:
             Dictionary with default configuration
         """
-        try:
-            return yaml.safe_load(DEFAULT_CONFIG)
-        except yaml.YAMLError as e:
-            raise ReorgError(f"Failed to parse default configuration: {e}")
+        return copy.deepcopy(_default_config_dict())
     
     @staticmethod
     def validate_config(config: ReorgConfig) -> bool:
@@ -145,21 +235,41 @@ class ConfigLoader:
         Raises:
             ReorgError: If configuration is invalid
         """
+        ConfigLoader._validate_root(config.project_root)
+        ConfigLoader._validate_log_level(config.log_level)
+        
+        return True
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _validate_root(project_root: str) -> None:
+        """
+        Check that the project root is set and exists.
+        
+        Successful checks are cached per path (failures are not, since
+        lru_cache does not cache exceptions); see clear_cache().
+        
+        Raises:
+            ReorgError: If project_root is empty or does not exist
+        """
         # Check required fields
-        if not config.project_root:
+        if not project_root:
             raise ReorgError("Configuration error: project_root is required")
         
         # Check project root exists
-        project_path = Path(config.project_root)
-        if not project_path.exists():
-            raise ReorgError(f"Configuration error: project_root does not exist: {config.project_root}")
-        
-        # Check log level
-        valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if config.log_level.upper() not in valid_log_levels:
-            raise ReorgError(f"Configuration error: invalid log_level: {config.log_level}")
+        if not os.path.exists(project_root):
+            raise ReorgError(f"Configuration error: project_root does not exist: {project_root}")
+    
+    @staticmethod
+    def _validate_log_level(log_level: str) -> None:
+        """
+        Check that the log level is one of the standard logging levels.
         
-        return True
+        Raises:
+            ReorgError: If log_level is not recognised
+        """
+        if log_level.upper() not in _VALID_LOG_LEVELS:
+            raise ReorgError(f"Configuration error: invalid log_level: {log_level}")
     
     @staticmethod
     def create_default_config(output_path: str) -> str:
@@ -191,6 +301,44 @@ class ConfigLoader:
         except Exception as e:
             raise ReorgError(f"Failed to create configuration file: {e}")
     
+    @staticmethod
+    def create_cached_json(yaml_path: str) -> str:
+        """
+        Write a JSON copy of a YAML configuration file next to it.
+        
+        The copy is named ``<name>.cache.json`` and records the YAML file's
+        mtime and size. load_config() reads it instead of re-parsing the YAML
+        until the YAML file is modified again.
+        
+        Args:
+            yaml_path: Path to the YAML configuration file
+        
+        Returns:
+            Path to created JSON file
+        """
+        if os.path.splitext(yaml_path)[1] == '.json':
+            raise ReorgError(f"Configuration file is already JSON: {yaml_path}")
+        
+        # Stat before parsing: if the file changes in between, the copy is stale
+        try:
+            stat = os.stat(yaml_path)
+        except OSError:
+            raise ReorgError(f"Configuration file not found: {yaml_path}")
+        config_dict = ConfigLoader._load_yaml(yaml_path)
+        json_path = os.path.abspath(yaml_path) + _JSON_CACHE_SUFFIX
+        
+        try:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'source': {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size},
+                    'config': config_dict,
+                }, f, ensure_ascii=False, indent=2)
+            
+            return json_path
+        
+        except Exception as e:
+            raise ReorgError(f"Failed to create JSON configuration file: {e}")
+    
     @staticmethod
     def merge_configs(base_config: Dict[str, Any], override_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -205,15 +353,19 @@ class ConfigLoader:
         Returns:
             Merged configuration dictionary
         """
-        merged = base_config.copy()
-        
-        for key, value in override_config.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                # Recursively merge nested dictionaries
-                merged[key] = ConfigLoader.merge_configs(merged[key], value)
-            else:
-                # Override value
-                merged[key] = value
+        merged = copy.deepcopy(base_config)
+        
+        # Walk nested dictionaries with an explicit stack instead of recursing
+        stack = [(merged, override_config)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    # Merge nested dictionaries
+                    stack.append((target[key], value))
+                else:
+                    # Override value
+                    target[key] = copy.deepcopy(value)
         
         return merged
     
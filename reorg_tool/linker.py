@@ -4,6 +4,7 @@ Symbolic link module for the reorganization system.
 Creates and manages symbolic links to maintain backward compatibility.
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import List, Tuple, Optional
@@ -12,6 +13,20 @@ from .transaction_log import TransactionLog
 from .exceptions import FileOperationError
 
 
+@functools.lru_cache(maxsize=4096)
+def _relpath_cached(project_root: str, link_path: str, target_path: str) -> str:
+    """
+    Relative path from the directory containing link_path to target_path.
+    
+    Keyed on the project root as well, since paths containing '..' can
+    resolve differently under different roots. Raises ValueError (not
+    cached) when no relative path exists, e.g. across Windows drives.
+    """
+    root = Path(project_root)
+    link_dir = (root / link_path).parent
+    return os.path.relpath(root / target_path, link_dir)
+
+
 class SymbolicLinker:
     """Creates and manages symbolic links for file reorganization."""
     
@@ -24,6 +39,8 @@ class SymbolicLinker:
             transaction_log: Transaction log instance (optional)
         """
         self.project_root = Path(project_root).resolve()
+        # String form for os.path hot paths (avoids PurePath overhead per call)
+        self.project_root_str = str(self.project_root)
         self.transaction_log = transaction_log
         
         if not self.project_root.exists():
@@ -40,17 +57,9 @@ class SymbolicLinker:
         Returns:
             Relative path string from link to target
         """
-        # Convert to absolute paths
-        link_abs = self.project_root / link_path
-        target_abs = self.project_root / target_path
-        
-        # Get the directory containing the link
-        link_dir = link_abs.parent
-        
         # Calculate relative path from link directory to target
         try:
-            relative = os.path.relpath(target_abs, link_dir)
-            return relative
+            return _relpath_cached(self.project_root_str, link_path, target_path)
         except ValueError as e:
             # This can happen on Windows with different drives
             raise FileOperationError(
@@ -81,8 +90,8 @@ class SymbolicLinker:
                 )
             raise FileOperationError(error_msg)
         
-        # Check if link already exists
-        if link_abs.exists() or link_abs.is_symlink():
+        # Check if link already exists (lexists also catches dangling links)
+        if os.path.lexists(link_abs):
             error_msg = f"Link path already exists: {link_path}"
             if self.transaction_log is not None:
                 self.transaction_log.log_operation(
@@ -292,22 +301,31 @@ class SymbolicLinker:
             return []
         
         links = []
+        root = self.project_root_str
         
-        for item in search_path.rglob('*'):
-            if item.is_symlink():
-                try:
-                    relative_link = item.relative_to(self.project_root)
-                    target = self.get_link_target(str(relative_link))
-                    is_valid = self.verify_link(str(relative_link))
+        # Walk with an explicit stack; DirEntry answers is_symlink()/is_dir()
+        # from the directory listing, without a stat per entry
+        stack = [str(search_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            for entry in entries:
+                if entry.is_symlink():
+                    relative_link = os.path.relpath(entry.path, root)
+                    target = self.get_link_target(relative_link)
+                    is_valid = self.verify_link(relative_link)
                     
                     links.append({
-                        'link_path': str(relative_link),
+                        'link_path': relative_link,
                         'target_path': target,
                         'is_valid': is_valid,
                     })
-                except ValueError:
-                    # Skip links outside project root
-                    pass
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
         
         return links
     
@@ -7,6 +7,11 @@ from typing import List, Dict, Optional
 from enum import Enum
 from datetime import datetime
 from pathlib import Path
+import sys
+
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 class FileCategory(Enum):
@@ -44,9 +49,9 @@ class ReorgPhase(Enum):
     REPORT = "report"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class FileInfo:
-    """Information about a file in the project."""
+    """Information about a file in the project (immutable)."""
     path: str
     name: str
     size: int
@@ -78,7 +83,12 @@ class ReorgConfig:
     log_level: str = "INFO"
     
     def __post_init__(self):
-        """Validate configuration after initialization."""
+        """
+        Validate configuration after initialization.
+        
+        Only cheap field checks belong here; filesystem checks (e.g. that
+        project_root exists) live in ConfigLoader.validate_config.
+        """
         if not self.project_root:
             raise ValueError("project_root is required")
         
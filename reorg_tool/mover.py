@@ -4,11 +4,13 @@ File mover module for the reorganization system.
 Safely moves files with verification and rollback support.
 """
 
+import errno
+import os
 import shutil
-import hashlib
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from .backup import _file_checksum
 from .transaction_log import TransactionLog
 from .exceptions import FileOperationError
 
@@ -32,7 +34,11 @@ class FileMover:
     
     def move_file(self, source: str, destination: str) -> dict:
         """
-        Safely move a single file (copy + verify + delete).
+        Safely move a single file.
+        
+        Within one filesystem the file is renamed, which is atomic and copies
+        no data. Across filesystems, and for symbolic links (whose target is
+        copied as a regular file), it falls back to copy + verify + delete.
         
         Args:
             source: Source file path (relative to project root)
@@ -71,27 +77,42 @@ class FileMover:
             # Create destination directory if needed
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Copy file to destination
-            shutil.copy2(source_path, dest_path)
-            
-            # Verify copy integrity
-            checksum_after = self._calculate_checksum(dest_path)
-            
-            if checksum_before != checksum_after:
-                # Cleanup failed copy
-                dest_path.unlink()
-                error_msg = "Checksum mismatch after copy"
-                if self.transaction_log is not None:
-                    self.transaction_log.log_operation(
-                        'move', source, destination,
-                        success=False, error_message=error_msg,
-                        checksum_before=checksum_before,
-                        checksum_after=checksum_after
-                    )
-                raise FileOperationError(error_msg)
+            # Same filesystem: the renamed inode keeps its content. Symlinks
+            # are copied instead, since renaming a relative link into another
+            # directory would leave it dangling
+            renamed = False
+            if not source_path.is_symlink():
+                try:
+                    os.rename(source_path, dest_path)
+                    renamed = True
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
             
-            # Delete source file
-            source_path.unlink()
+            if renamed:
+                checksum_after = checksum_before
+            else:
+                # Copy file to destination
+                shutil.copy2(source_path, dest_path)
+                
+                # Verify copy integrity
+                checksum_after = self._calculate_checksum(dest_path)
+                
+                if checksum_before != checksum_after:
+                    # Cleanup failed copy
+                    dest_path.unlink()
+                    error_msg = "Checksum mismatch after copy"
+                    if self.transaction_log is not None:
+                        self.transaction_log.log_operation(
+                            'move', source, destination,
+                            success=False, error_message=error_msg,
+                            checksum_before=checksum_before,
+                            checksum_after=checksum_after
+                        )
+                    raise FileOperationError(error_msg)
+                
+                # Delete source file
+                source_path.unlink()
             
             # Log successful operation
             if self.transaction_log is not None:
@@ -190,13 +211,8 @@ class FileMover:
         Returns:
             MD5 checksum string
         """
-        md5 = hashlib.md5()
-        
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    md5.update(chunk)
-            return md5.hexdigest()
+            return _file_checksum(file_path)
         except Exception as e:
             raise FileOperationError(f"Failed to calculate checksum: {e}")
     
@@ -4,8 +4,9 @@ Reporter module for the reorganization system.
 Generates reports and documentation about reorganization results.
 """
 
+import os
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 from datetime import datetime
 
 from .models import ReorgResult, FileCategory
@@ -178,35 +179,60 @@ class ReorganizationReporter:
         Returns:
             Directory tree as string
         """
+        return "\n".join(self.iter_directory_tree(directory, max_depth, show_files))
+    
+    def iter_directory_tree(
+        self,
+        directory: Optional[str] = None,
+        max_depth: int = 3,
+        show_files: bool = True
+    ) -> Iterator[str]:
+        """
+        Yield the lines of a visual directory tree one at a time.
+        
+        Args:
+            directory: Directory to visualize (None for project root)
+            max_depth: Maximum depth to traverse
+            show_files: Whether to show files or only directories
+        
+        Yields:
+            Directory tree lines (without trailing newlines)
+        """
         if directory:
             root_path = self.project_root / directory
         else:
             root_path = self.project_root
         
         if not root_path.exists():
-            return f"Directory does not exist: {root_path}"
+            yield f"Directory does not exist: {root_path}"
+            return
+        
+        yield f"{root_path.name}/"
         
-        lines = [f"{root_path.name}/"]
+        # Skip hidden and special directories
+        skip_names = {'.git', '__pycache__', '.pytest_cache', 'node_modules', '.venv', 'venv'}
         
-        def add_tree_lines(path: Path, prefix: str = "", depth: int = 0):
-            """Recursively add tree lines."""
+        def tree_lines(path: str, prefix: str = "", depth: int = 0):
+            """Recursively yield tree lines."""
             if depth >= max_depth:
                 return
             
+            # DirEntry caches the file type from the directory listing, so
+            # is_dir() only needs an extra stat() for symlinks
             try:
-                items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
+                with os.scandir(path) as it:
+                    items = [(entry.is_dir(), entry) for entry in it
+                             if entry.name not in skip_names]
             except PermissionError:
                 return
             
             # Filter items
             if not show_files:
-                items = [item for item in items if item.is_dir()]
+                items = [item for item in items if item[0]]
             
-            # Skip hidden and special directories
-            skip_names = {'.git', '__pycache__', '.pytest_cache', 'node_modules', '.venv', 'venv'}
-            items = [item for item in items if item.name not in skip_names]
+            items.sort(key=lambda x: (not x[0], x[1].name))
             
-            for i, item in enumerate(items):
+            for i, (is_dir, entry) in enumerate(items):
                 is_last = (i == len(items) - 1)
                 
                 # Determine the tree characters
@@ -218,23 +244,21 @@ class ReorganizationReporter:
                     next_prefix = "│   "
                 
                 # Add item name
-                if item.is_dir():
-                    lines.append(f"{prefix}{current_prefix}{item.name}/")
+                if is_dir:
+                    yield f"{prefix}{current_prefix}{entry.name}/"
                     # Recurse into directory
-                    add_tree_lines(item, prefix + next_prefix, depth + 1)
-                elif item.is_symlink():
+                    yield from tree_lines(entry.path, prefix + next_prefix, depth + 1)
+                elif entry.is_symlink():
                     # Show symbolic link with arrow
                     try:
-                        target = item.readlink()
-                        lines.append(f"{prefix}{current_prefix}{item.name} -> {target}")
+                        target = os.readlink(entry.path)
+                        yield f"{prefix}{current_prefix}{entry.name} -> {target}"
                     except:
-                        lines.append(f"{prefix}{current_prefix}{item.name} -> [broken]")
+                        yield f"{prefix}{current_prefix}{entry.name} -> [broken]"
                 else:
-                    lines.append(f"{prefix}{current_prefix}{item.name}")
+                    yield f"{prefix}{current_prefix}{entry.name}"
         
-        add_tree_lines(root_path)
-        
-        return "\n".join(lines)
+        yield from tree_lines(root_path)
     
     def create_markdown_report(
         self,
@@ -0,0 +1 @@
+../../dev/tests/conftest.py
\ No newline at end of file
@@ -93,6 +93,17 @@ class TestTransactionLog:
         assert new_log.entries[0].operation == 'move'
         assert new_log.entries[1].operation == 'link'
     
+    def test_autosave_disabled(self, log_path):
+        """Test that entries stay in memory until save() when autosave is off."""
+        log = TransactionLog(log_path, autosave=False)
+        log.log_operation('move', 'file1.txt', 'new/file1.txt')
+        
+        assert len(log) == 1
+        assert not Path(log_path).exists()
+        
+        log.save()
+        assert len(TransactionLog(log_path).load_log()) == 1
+    
     def test_load_nonexistent_log(self, temp_dir):
         """Test loading a nonexistent log file."""
         log_path = str(Path(temp_dir) / "nonexistent.log")
@@ -16,14 +16,17 @@ from .exceptions import FileOperationError
 class TransactionLog:
     """Records and manages transaction log for file operations."""
     
-    def __init__(self, log_path: str):
+    def __init__(self, log_path: str, autosave: bool = True):
         """
         Initialize the transaction log.
         
         Args:
             log_path: Path to the transaction log file
+            autosave: Rewrite the log file after every logged operation;
+                if False, entries stay in memory until save() is called
         """
         self.log_path = Path(log_path)
+        self.autosave = autosave
         self.entries: List[TransactionEntry] = []
         self.reorganization_id = f"reorg_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.start_time = datetime.now()
@@ -70,7 +73,8 @@ class TransactionLog:
         self.entries.append(entry)
         
         # Auto-save after each operation
-        self.save()
+        if self.autosave:
+            self.save()
         
         return entry
     
@@ -6,6 +6,7 @@ Validates reorganization results including symbolic links, imports, and function
 
 import importlib
 import importlib.util
+import os
 import sys
 from pathlib import Path
 from typing import List, Optional, Dict
@@ -245,27 +246,28 @@ class ReorganizationValidator:
             List of module names
         """
         modules = []
+        root = str(self.project_root)
+        skip_dirs = {'.git', '__pycache__', '.pytest_cache', 'venv', 'env', '.venv'}
         
-        # Find all Python files
-        for py_file in self.project_root.rglob("*.py"):
-            # Skip test files and __init__.py
-            if py_file.name.startswith("test_") or py_file.name == "__init__.py":
-                continue
+        # Find all Python files, pruning skipped directories instead of
+        # walking into them and filtering afterwards
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in skip_dirs]
             
-            # Skip files in certain directories
-            skip_dirs = {'.git', '__pycache__', '.pytest_cache', 'venv', 'env', '.venv'}
-            if any(skip_dir in py_file.parts for skip_dir in skip_dirs):
-                continue
+            rel_dir = os.path.relpath(dirpath, root)
+            package_parts = [] if rel_dir == os.curdir else rel_dir.split(os.sep)
             
-            # Convert file path to module name
-            try:
-                relative_path = py_file.relative_to(self.project_root)
-                module_parts = list(relative_path.parts[:-1]) + [relative_path.stem]
-                module_name = ".".join(module_parts)
-                modules.append(module_name)
-            except ValueError:
-                # File is outside project root
-                continue
+            for filename in filenames:
+                if not filename.endswith(".py"):
+                    continue
+                
+                # Skip test files and __init__.py
+                if filename.startswith("test_") or filename == "__init__.py":
+                    continue
+                
+                # Convert file path to module name
+                module_parts = package_parts + [filename[:-3]]
+                modules.append(".".join(module_parts))
         
         return modules
     